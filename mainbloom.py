@@ -1,12 +1,72 @@
 # minebloom.py
 import tkinter as tk
-from tkinter import messagebox, simpledialog
+from tkinter import messagebox, simpledialog, ttk
+import tkinter.font as tkfont
 from abc import ABC, abstractmethod
 import random
 import datetime
 import json
+import atexit
+import hashlib
+import hmac
+import logging
 import os
 import re
+import sys
+from contextlib import contextmanager
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque, namedtuple
+from functools import cached_property
+from itertools import accumulate, groupby
+
+# orjson is optional: it is much faster for the journal save/load path,
+# but the app keeps working with the standard library json module.
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    _loads = json.loads
+
+_log = logging.getLogger(__name__)
+
+
+class _SafeNameTable(dict):
+    """str.translate table that deletes characters not allowed in a journal file name.
+
+    Entries are filled in lazily, so each distinct character is classified once.
+    """
+    def __missing__(self, codepoint):
+        c = chr(codepoint)
+        value = c if c.isalnum() or c in ' ._' else None
+        self[codepoint] = value
+        return value
+
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+# directory holding the journal files, resolved once at import time
+_JOURNAL_DIR = os.getcwd()
+
+# parsed journals shared by every User in this process:
+# path -> ((mtime_ns, size), entries); reused while the file is unchanged
+_JOURNAL_CACHE = {}
+
+_MIDNIGHT = datetime.time.min
+
+
+def set_journal_dir(path: str):
+    """Change where journal files of users created afterwards are stored."""
+    global _JOURNAL_DIR
+    _JOURNAL_DIR = path
 
 # =========================
 # BUSINESS LOGIC (OOP, Abstraction, Encapsulation, Inheritance, Polymorphism)
@@ -14,16 +74,43 @@ import re
 
 class User:
     """Encapsulation: menyimpan data user (private attributes)."""
-    def __init__(self, username: str, partner: str):
+    def __init__(self, username: str, partner: str, scheduler=None, durable: bool = False):
         self._username = username
         self._partner = partner
-        self._journal_password = None
-        self._journal_entries = []
-        # file for persisting this user's journals
-        safe_name = ''.join(c for c in username if c.isalnum() or c in (' ','.','_')).rstrip()
-        self._journal_file = os.path.join(os.getcwd(), f"journals_{safe_name}.json")
-        # try load existing
-        self._load_journals()
+        self._journal_password = None  # (salt, digest), never the plain password
+        # journal entries as parallel lists (date, content, ISO date string per entry),
+        # so date-only or content-only scans walk one contiguous list; kept sorted by
+        # date and loaded lazily on first access, see _ensure_loaded()
+        self._dates = None
+        self._contents = None
+        self._isos = None
+        # bumped whenever the entries change, so views can tell when their cache is stale
+        self._journal_revision = 0
+        # ISO day -> [(date, content), ...] in date order, kept up to date on every insert;
+        # the sorted list of days is only rebuilt after the entries changed
+        self._by_date = defaultdict(list)
+        self._grouped_cache = None
+        self._grouped_dirty = True
+        # serialized lines added since the last save, appended to the file on the next flush
+        self._pending = []
+        # set when the whole journal still has to be written out, e.g. after a failed
+        # legacy migration; the next save rewrites the file instead of appending
+        self._needs_rewrite = False
+        # when True, add_journal_entry defers persisting until buffered() exits
+        self._buffering = False
+        # unsaved changes are flushed at most once per burst; `scheduler` is any Tk
+        # widget (after/after_cancel) used to debounce, without one saves are immediate
+        self._scheduler = scheduler
+        self._dirty = False
+        self._flush_after_ms = 500
+        self._flush_job = None
+        # fsync after every append; off by default since the file is flushed on close anyway
+        self._durable = durable
+        # file for persisting this user's journals (JSON Lines, one entry per line);
+        # the older single-array .json file is migrated on first load
+        safe_name = username.translate(_SAFE_NAME_TABLE).rstrip()
+        self._journal_file = os.path.join(_JOURNAL_DIR, f"journals_{safe_name}.jsonl")
+        self._legacy_journal_file = os.path.join(_JOURNAL_DIR, f"journals_{safe_name}.json")
 
     # Encapsulated accessors
     @property
@@ -34,56 +121,320 @@ class User:
     def partner(self):
         return self._partner
 
+    @property
+    def journal_revision(self):
+        # load first: the lazy load bumps the revision, so a value read before it goes stale
+        self._ensure_loaded()
+        return self._journal_revision
+
+    @staticmethod
+    def _hash_password(pwd: str, salt: bytes) -> bytes:
+        return hashlib.blake2b(pwd.encode('utf-8'), salt=salt, digest_size=32).digest()
+
     def set_journal_password(self, pwd: str):
-        self._journal_password = pwd
+        salt = os.urandom(16)
+        self._journal_password = (salt, self._hash_password(pwd, salt))
 
     def check_journal_password(self, pwd: str) -> bool:
-        return self._journal_password == pwd
+        if self._journal_password is None:
+            return False
+        salt, digest = self._journal_password
+        # constant-time comparison
+        return hmac.compare_digest(self._hash_password(pwd, salt), digest)
+
+    def _ensure_loaded(self):
+        # read the journal file only when the journal is actually used
+        if self._dates is None:
+            self._set_entries((), (), ())
+            self._load_journals()
+
+    def _set_entries(self, dates, contents, isos):
+        self._dates, self._contents, self._isos = self._sort_entries(dates, contents, isos)
+        self._journal_revision += 1
+        self._index_by_date()
+
+    def _index_by_date(self):
+        # the entries are sorted, so each day is contiguous and one groupby pass buckets them;
+        # the stored ISO string already starts with the day
+        entries = zip(self._dates, self._isos, self._contents)
+        self._by_date = defaultdict(list, ((day, [(dt, content) for dt, _, content in group])
+                                           for day, group in groupby(entries, key=lambda it: it[1][:10])))
+        self._grouped_dirty = True
 
     def add_journal_entry(self, entry: str, date: datetime.datetime = None):
-        # store entries as (date, content)
+        self._ensure_loaded()
+        # store date, content and ISO string; the ISO string is formatted once here
         if date is None:
             date = datetime.datetime.now()
         # normalize date to datetime at midnight if a date object provided
-        if isinstance(date, datetime.date) and not isinstance(date, datetime.datetime):
-            date = datetime.datetime(date.year, date.month, date.day)
-        self._journal_entries.append((date, entry))
+        if type(date) is datetime.date:
+            date = datetime.datetime.combine(date, _MIDNIGHT)
+        iso = date.isoformat()
+        # serialize up front so a value that can't be saved is rejected here,
+        # instead of blocking every later flush
+        line = _dumps({"date": iso, "content": entry}) + b"\n"
+        # insert in date order; bisect_right puts it after entries with the same date
+        i = bisect_right(self._dates, date)
+        # the day's entries are contiguous in the sorted list, so the position inside
+        # the day bucket is the offset from the first entry of that day
+        day_start = bisect_left(self._dates, date.replace(hour=0, minute=0, second=0, microsecond=0))
+        self._dates.insert(i, date)
+        self._contents.insert(i, entry)
+        self._isos.insert(i, iso)
+        day = self._by_date[iso[:10]]
+        if not day:
+            self._grouped_dirty = True  # a new day changes the list of days
+        day.insert(i - day_start, (date, entry))
+        self._pending.append(line)
+        self._journal_revision += 1
+        self._dirty = True
+        if self._buffering:
+            return
+        if self._scheduler is not None:
+            # debounce: a burst of additions collapses into one save
+            if self._flush_job is None:
+                self._flush_job = self._scheduler.after(self._flush_after_ms, self._flush_if_dirty)
+            return
         # persist after adding
-        try:
-            self._save_journals()
-        except Exception:
-            pass
+        self._flush_if_dirty()
 
     def get_journal_entries(self):
-        return list(self._journal_entries)
+        self._ensure_loaded()
+        return tuple(zip(self._dates, self._contents))
+
+    def iter_journal_entries(self):
+        # (date, content) pairs without building a copy of the whole journal
+        self._ensure_loaded()
+        return zip(self._dates, self._contents)
+
+    def grouped_journal_entries(self):
+        # [(ISO date, [(date, content), ...]), ...] per day, oldest first; callers must not modify it
+        self._ensure_loaded()
+        if self._grouped_dirty:
+            # only the days are sorted here; each day's list is already in order
+            self._grouped_cache = sorted(self._by_date.items())
+            self._grouped_dirty = False
+        return self._grouped_cache
+
+    @contextmanager
+    def buffered(self):
+        """Group several add_journal_entry calls into a single write on exit."""
+        previous = self._buffering
+        self._buffering = True
+        try:
+            yield self
+        finally:
+            self._buffering = previous
+            if not previous:
+                self.flush()
+
+    def flush(self):
+        """Persist pending changes now and cancel any scheduled save."""
+        if self._flush_job is not None:
+            try:
+                self._scheduler.after_cancel(self._flush_job)
+            except tk.TclError:
+                # the scheduler window is already gone
+                pass
+        self._flush_if_dirty()
+
+    def _flush_if_dirty(self):
+        self._flush_job = None
+        if self._dirty:
+            self._dirty = False
+            self._save_journals()
 
     def _save_journals(self):
-        # write journal entries as list of dicts with ISO timestamps
-        data = []
-        for dt, content in self._journal_entries:
-            data.append({"date": dt.isoformat(), "content": content})
+        if self._needs_rewrite:
+            try:
+                self._rewrite_journals()
+            except OSError as exc:
+                _log.warning("Could not save journal %s: %s", self._journal_file, exc)
+                self._dirty = True  # still unsaved, so the next flush retries
+                return
+            self._needs_rewrite = False
+            return
+        # append only the entries added since the last save, one JSON object per line
+        if not self._pending:
+            return
         try:
-            with open(self._journal_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+            with open(self._journal_file, 'ab', buffering=65536) as f:
+                f.writelines(self._pending)
+                if self._durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+        except OSError as exc:
+            # keep the pending records and stay dirty so the next flush retries them
+            _log.warning("Could not save journal %s: %s", self._journal_file, exc)
+            self._dirty = True
+            return
+        self._pending = []
+        # the cached snapshot is now behind the file; drop it rather than copy every
+        # entry on each append, the next load re-reads the file
+        _JOURNAL_CACHE.pop(self._journal_file, None)
+
+    def _rewrite_journals(self):
+        # write every entry from scratch (legacy migration / compaction); the data goes
+        # to a temp file first so a crash can never leave a half-written journal behind
+        payload = b"".join(_dumps({"date": iso, "content": content}) + b"\n"
+                           for content, iso in zip(self._contents, self._isos))
+        tmp = self._journal_file + '.tmp'
+        with open(tmp, 'wb', buffering=65536) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._journal_file)
+        self._pending = []
+        self._update_journal_cache()
+
+    def _update_journal_cache(self):
+        # the in-memory entries now match the file on disk; only called after a full
+        # rewrite, appends just invalidate the cache
+        try:
+            st = os.stat(self._journal_file)
+        except OSError:
+            _JOURNAL_CACHE.pop(self._journal_file, None)
+            return
+        _JOURNAL_CACHE[self._journal_file] = ((st.st_mtime_ns, st.st_size),
+                                              (tuple(self._dates), tuple(self._contents), tuple(self._isos)))
+
+    @staticmethod
+    def _sort_entries(dates, contents, isos):
+        # order the parallel lists by date; the sort is stable, so entries with the
+        # same date keep their file order (and already sorted input costs O(n))
+        order = sorted(range(len(dates)), key=dates.__getitem__)
+        return [dates[i] for i in order], [contents[i] for i in order], [isos[i] for i in order]
+
+    @staticmethod
+    def _entry_from_item(item):
+        try:
+            dt = datetime.datetime.fromisoformat(item.get('date'))
+        except (TypeError, ValueError):
+            dt = datetime.datetime.now()
+        return (dt, item.get('content', ''), dt.isoformat())
 
     def _load_journals(self):
         if not os.path.exists(self._journal_file):
+            if os.path.exists(self._legacy_journal_file):
+                self._migrate_legacy_journals()
             return
         try:
-            with open(self._journal_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            self._journal_entries = []
-            for item in data:
-                try:
-                    dt = datetime.datetime.fromisoformat(item.get('date'))
-                except Exception:
-                    dt = datetime.datetime.now()
-                self._journal_entries.append((dt, item.get('content', '')))
-        except Exception:
-            self._journal_entries = []
+            st = os.stat(self._journal_file)
+        except OSError:
+            return
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _JOURNAL_CACHE.get(self._journal_file)
+        if cached is not None and cached[0] == key:
+            self._set_entries(*cached[1])
+            return
+        # stream the file line by line so peak memory stays close to one entry
+        dates, contents, isos = [], [], []
+        torn = False
+        try:
+            with open(self._journal_file, 'rb', buffering=65536) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        item = _loads(line)
+                    except ValueError:
+                        item = None
+                    if not isinstance(item, dict):
+                        # skip a torn line, e.g. left by an interrupted append
+                        torn = True
+                        continue
+                    dt, content, iso = self._entry_from_item(item)
+                    dates.append(dt)
+                    contents.append(content)
+                    isos.append(iso)
+        except OSError as exc:
+            _log.warning("Could not read journal %s: %s", self._journal_file, exc)
+            dates, contents, isos = [], [], []
+            torn = False  # never compact from a partial read
+        else:
+            dates, contents, isos = self._sort_entries(dates, contents, isos)
+            _JOURNAL_CACHE[self._journal_file] = (key, (tuple(dates), tuple(contents), tuple(isos)))
+        self._dates, self._contents, self._isos = dates, contents, isos
+        self._index_by_date()
+        if torn:
+            # compact the file so new appends don't land after the broken line
+            try:
+                self._rewrite_journals()
+            except OSError as exc:
+                _log.warning("Could not compact journal %s: %s", self._journal_file, exc)
 
+    def _migrate_legacy_journals(self):
+        # journals used to be a single JSON array; convert them to JSON Lines once
+        try:
+            with open(self._legacy_journal_file, 'rb') as f:
+                data = _loads(f.read())
+            rows = [self._entry_from_item(item) for item in data if isinstance(item, dict)]
+        except (OSError, ValueError, TypeError) as exc:
+            _log.warning("Could not read journal %s: %s", self._legacy_journal_file, exc)
+            return
+        self._set_entries([r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows])
+        try:
+            self._rewrite_journals()
+        except OSError as exc:
+            # keep the parsed entries in memory and write them out on the next save
+            _log.warning("Could not migrate journal %s: %s", self._legacy_journal_file, exc)
+            self._needs_rewrite = True
+            self._dirty = True
+
+# mood scale emojis; the radio button for EMOJIS[i] has the value i+1
+EMOJIS = ("😢", "😕", "😐", "🙂", "😄", "😂", "🥰", "😇", "✨", "🫶🏻", "💸")
+
+# Affirmations (sample set)
+AFFIRMATIONS = (
+    "Kamu cantik, di dalam dan di luar.",
+    "Kamu hebat dalam caramu sendiri.",
+    "Kamu kuat lebih dari yang kamu kira.",
+    "Kamu baik dan penuh kasih sayang.",
+    "Kamu layak dicintai dan diperlakukan baik.",
+    "Kamu pantas menerima ketenangan.",
+    "Kamu cukup apa adanya.",
+    "Kamu berharga.",
+    "Kamu tidak sendiri.",
+    "Kamu boleh istirahat hari ini.",
+    "Kamu berhak atas batasan yang sehat.",
+    "Kamu boleh memilih diri sendiri.",
+    "Kamu tidak harus sempurna untuk dicintai.",
+    "Kamu berani karena kamu terus mencoba.",
+    "Kamu punya kekuatan dalam kelembutan.",
+    "Kamu boleh menetapkan batas.",
+    "Kamu layak mendapatkan rasa aman.",
+    "Kamu berhak merasa tenang.",
+    "Kamu mampu mengatasi ini perlahan-lahan.",
+    "Kamu pantas mendapat dukungan."
+)
+
+# playful suffixes for the automatic affirmation on the home screen
+PLAYFUL_SUFFIXES = (
+    "Keep going — you've got this (and maybe a cookie).",
+    "You're doing better than you think — tiny victory dance.",
+    "Slow breaths. Tiny wins. Big hugs (figurative).",
+    "Tiny progress is still progress — and very cool. 😌",
+    "You matter — and yes, even on weird days."
+)
+
+# religious reminders shown on the home screen's Daily Reminder card
+REMINDER_TEXT = (
+    "1. You are never alone; Allah is always with you.\n"
+    "﴿ فَإِنَّ مَعَ الْعُسْرِ يُسْرًا ۝ إِنَّ مَعَ الْعُسْرِ يُسْرًا ﴾\n"
+    "Surah Al-Inshirah (94): 5–6\n\n"
+    "2. You are strong. Allah never burdens a soul beyond what it can bear.\n"
+    "﴿ لَا يُكَلِّفُ اللَّهُ نَفْسًا إِلَّا وُسْعَهَا ﴾\n"
+    "Surah Al-Baqarah (2): 286\n\n"
+    "3. Trust Allah. What is written for you will always find its way.\n"
+    "﴿ وَمَن يَتَوَكَّلْ عَلَى اللَّهِ فَهُوَ حَسْبُهُ ﴾\n"
+    "Surah At-Talaq (65): 3\n\n"
+    "4. Let your heart rest—peace comes from remembering Allah.\n"
+    "﴿ أَلَا بِذِكْرِ اللَّهِ تَطْمَئِنُّ الْقُلُوبُ ﴾\n"
+    "Surah Ar-Ra‘d (13): 28\n\n"
+    "5. Every step you take to improve yourself, Allah guides you further.\n"
+    "﴿ وَالَّذِينَ جَاهَدُوا فِينَا لَنَهْدِيَنَّهُمْ سُبُلَنَا ﴾\n"
+    "Surah Al-‘Ankabut (29): 69"
+)
 
 # Abstraction: base class untuk affirmation provider
 class AffirmationProvider(ABC):
@@ -95,45 +446,144 @@ class AffirmationProvider(ABC):
 class DailyAffirmationProvider(AffirmationProvider):
     def __init__(self, affirmations):
         self._affirmations = affirmations
+        self._n = len(affirmations)
+        # the index only changes at midnight, so remember it per day
+        self._cached_day = None
+        self._cached_idx = None
 
     def get_affirmation(self):
         # Polymorphism: implementasi spesifik memilih afirmasi berdasarkan hari
-        index = datetime.date.today().toordinal() % len(self._affirmations)
-        return self._affirmations[index]
+        today = datetime.date.today()
+        if today != self._cached_day:
+            self._cached_day = today
+            self._cached_idx = today.toordinal() % self._n
+        return self._affirmations[self._cached_idx]
+
+_choice = random.choice
+_choices = random.choices
 
 class RandomAffirmationProvider(AffirmationProvider):
     def __init__(self, affirmations):
         self._affirmations = affirmations
 
     def get_affirmation(self):
-        return random.choice(self._affirmations)
+        return _choice(self._affirmations)
+
+    def get_affirmations(self, n: int):
+        # n random picks (with repetition) in one call
+        return _choices(self._affirmations, k=n)
+
+
+# an affirmation saved to the gallery, as pushed onto the StackManager
+SavedAff = namedtuple('SavedAff', ['text', 'date'])
 
 
 # Stack manager (undo recent mood entries)
+MAX_UNDO = 100  # oldest items fall off once the undo history is full
+
 class StackManager:
-    def __init__(self):
-        self._stack = []  # LIFO
+    def __init__(self, maxlen: int = MAX_UNDO):
+        self._stack = deque(maxlen=maxlen)  # LIFO
 
     def push(self, item):
         self._stack.append(item)
 
     def pop(self):
-        if self._stack:
-            return self._stack.pop()
-        return None
+        return self._stack.pop() if self._stack else None
 
     def peek(self):
         return self._stack[-1] if self._stack else None
 
     def list_all(self):
-        return list(self._stack)
+        # read-only snapshot so callers cannot mutate the history
+        return tuple(self._stack)
 
 
 # =========================
 # UI (Tkinter)
 # =========================
 
+# relationship scan questions; 'pasangan' is replaced with the partner's name
+_RELATIONSHIP_QUESTIONS = (
+    "Apakah pasanganmu mendukung impianmu?",
+    "Apakah pasangan menghargai perasaanmu?",
+    "Apakah komunikasi berjalan terbuka?",
+    "Apakah ada pengendalian berlebih dari pasangan?",
+    "Apakah pasangan mau minta maaf saat salah?",
+    "Apakah kalian bisa berbagi tanggung jawab?",
+    "Apakah pasangan mendengarkan ketika kamu butuh bicara?",
+    "Apakah kamu merasa dihargai?",
+    "Apakah ada rasa aman bersama pasangan?",
+    "Apakah pasangan mendukung waktu pribadimu?",
+    "Apakah pasangan menghormati batasanmu?",
+    "Apakah konflik bisa diselesaikan dengan sehat?",
+    "Apakah pasangan menunjukkan empati?",
+    "Apakah pasangan memberimu ruang untuk tumbuh?",
+    "Apakah pasangan terbuka soal perasaannya?",
+    "Apakah pasangan mengapresiasi usahamu?",
+    "Apakah hubungan kalian memberi rasa tenang?",
+    "Apakah keputusan penting dibicarakan bersama?",
+    "Apakah pasangan memberi dukungan emosional?",
+    "Apakah ada kejujuran dalam hubungan?",
+    "Apakah pasangan menghargai keluargamu?",
+    "Apakah ada toleransi terhadap perbedaan?",
+    "Apakah pasangan menjaga komitmen?",
+    "Apakah pasangan mendorong kemandirianmu?",
+    "Apakah pasangan hadir saat kamu butuh?",
+    "Apakah komunikasi non-verbal terasa nyaman?",
+    "Apakah pasangan menerima kekuranganmu?",
+    "Apakah pasangan menyemangati mimpimu?",
+    "Apakah pasangan mendukung kesehatan mentalmu?",
+    "Apakah ada saling berbagi kegembiraan?",
+    "Apakah pasangan menghindari perilaku merendahkan?",
+    "Apakah pasangan memberi ruang untuk hobi?",
+    "Apakah ada rasa saling percaya?",
+    "Apakah pasangan bertanggung jawab secara finansial bersama?",
+    "Apakah pasangan menghormati privasimu?",
+    "Apakah pasangan membantu saat kamu lelah?",
+    "Apakah pasangan menunjukkan rasa terima kasih?",
+    "Apakah pasangan menghindari manipulasi emosional?",
+    "Apakah ada upaya memperbaiki saat salah?",
+    "Apakah hubungan memberikan energi positif?",
+    "Apakah pasangan memberi umpan balik yang membangun?",
+    "Apakah pasangan menghormati pendapatmu?",
+    "Apakah ada rasa aman dalam berbagi rahasia?",
+    "Apakah pasangan menepati janji?",
+    "Apakah kalian menikmati waktu berkualitas bersama?",
+    "Apakah pasangan peka terhadap kebutuhanmu?",
+    "Apakah ada kemauan berkembang bersama?",
+    "Apakah pasangan mendukung keputusan kariermu?",
+    "Apakah komunikasi tetap hangat meski sibuk?"
+)
+
+# red flag detector questions, substituted like the relationship questions
+_RED_FLAG_TEMPLATES = (
+    "Sering mengontrol apa yg kamu lakukan?",
+    "Sering menyalahkanmu atas segala hal?",
+    "Meminta isolasi dari teman/keluarga?",
+    "Tidak pernah bertanggung jawab atas perilaku buruk?",
+    "Ada ancaman atau intimidasi?"
+)
+
+# shared look of every _make_button button: pastel-blue background and deep-blue text
+_BUTTON_DEFAULTS = {
+    "bg": "#D6EEFF",
+    "activebackground": "#D6EEFF",
+    "fg": "#1E3A8A",
+    "bd": 1,
+    "relief": "solid",
+    "highlightthickness": 1,
+    "highlightbackground": "#9ED0FF",
+}
+
+
+
 class MineBloomApp(tk.Tk):
+    # 'pasanganmu' and 'pasangan' are swapped for the partner's name in a single pass
+    _PARTNER_RE = re.compile(r'pasangan(?:mu)?')
+    # text colour of an Entry while its placeholder is shown
+    _PLACEHOLDER_FG = "#BEBEBE"
+
     def __init__(self):
         super().__init__()
         # window setup
@@ -141,135 +591,95 @@ class MineBloomApp(tk.Tk):
         self.geometry("900x600")
         self.configure(bg="#FFF4F7")
 
+        # shared font objects: Tk resolves each font once instead of per widget
+        self.fonts = {
+            "title": tkfont.Font(self, family="Poppins", size=44, weight="bold"),
+            "greeting": tkfont.Font(self, family="Poppins", size=18, weight="bold"),
+            "heading": tkfont.Font(self, family="Poppins", size=16, weight="bold"),
+            "daily": tkfont.Font(self, family="Poppins", size=14, weight="bold"),
+            "button": tkfont.Font(self, family="Poppins", size=12, weight="bold"),
+            "subtitle": tkfont.Font(self, family="Quicksand", size=14),
+            "question": tkfont.Font(self, family="Quicksand", size=14, weight="bold"),
+            "label": tkfont.Font(self, family="Quicksand", size=12, weight="bold"),
+            "affirmation": tkfont.Font(self, family="Quicksand", size=12, slant="italic"),
+            "reminder": tkfont.Font(self, family="Quicksand", size=11),
+            "small": tkfont.Font(self, family="Quicksand", size=10),
+            "ornament": tkfont.Font(self, family="Segoe UI Emoji", size=20),
+            "mood_emoji": tkfont.Font(self, family="Segoe UI Emoji", size=60),
+            "journey_title": tkfont.Font(self, family="Poppins", size=20, weight="bold"),
+            "date_label": tkfont.Font(self, family="Quicksand", size=11, weight="bold"),
+            "result": tkfont.Font(self, family="Quicksand", size=12),
+            "girly": tkfont.Font(self, family="Segoe Script", size=14, slant="italic"),
+        }
+
+        # shared ttk styles: colours are configured once per style instead of per widget
+        style = ttk.Style(self)
+        style.configure("Mine.TFrame", background="#FFF4F7")
+        style.configure("Mine.TLabel", background="#FFF4F7", foreground="#E05F7D", font=self.fonts["label"])
+        style.configure("Mine.Title.TLabel", background="#FFF4F7", foreground="#E05F7D", font=self.fonts["title"])
+        style.configure("Mine.Subtitle.TLabel", background="#FFF4F7", foreground="#8B6C8E", font=self.fonts["subtitle"])
+        style.configure("Mine.TEntry", fieldbackground="#FFFFFF", foreground="#E05F7D", insertcolor="#E05F7D")
+
+        # placeholder entries share these handlers through their "Placeholder" bindtag
+        self.bind_class("Placeholder", "<FocusIn>", self._placeholder_focus_in)
+        self.bind_class("Placeholder", "<FocusOut>", self._placeholder_focus_out)
+
         # state
         self.current_user = None
         self.stack = StackManager()
-
-        # Affirmations (sample set)
-        self.affirmations = [
-            "Kamu cantik, di dalam dan di luar.",
-            "Kamu hebat dalam caramu sendiri.",
-            "Kamu kuat lebih dari yang kamu kira.",
-            "Kamu baik dan penuh kasih sayang.",
-            "Kamu layak dicintai dan diperlakukan baik.",
-            "Kamu pantas menerima ketenangan.",
-            "Kamu cukup apa adanya.",
-            "Kamu berharga.",
-            "Kamu tidak sendiri.",
-            "Kamu boleh istirahat hari ini.",
-            "Kamu berhak atas batasan yang sehat.",
-            "Kamu boleh memilih diri sendiri.",
-            "Kamu tidak harus sempurna untuk dicintai.",
-            "Kamu berani karena kamu terus mencoba.",
-            "Kamu punya kekuatan dalam kelembutan.",
-            "Kamu boleh menetapkan batas.",
-            "Kamu layak mendapatkan rasa aman.",
-            "Kamu berhak merasa tenang.",
-            "Kamu mampu mengatasi ini perlahan-lahan.",
-            "Kamu pantas mendapat dukungan."
-        ]
-
-        # providers
-        self.daily_provider = DailyAffirmationProvider(self.affirmations)
-        self.random_provider = RandomAffirmationProvider(self.affirmations)
+        self._rel_questions_cache = (None, None)  # (partner, substituted questions)
+        self._red_flag_cache = (None, None)  # (partner, substituted red flag items)
+        self._partner_sub_active = False
+        self._partner_quoted = ""
+        self._pending_text = {}  # widget -> text applied by _flush_pending_texts
+        self._flush_scheduled = False
+        self._toast = None  # label currently shown by _show_toast
+
+
+        # providers are created on first use, see daily_provider / random_provider
+        self._daily_aff_cache = (None, None)  # (date, today's affirmation)
+
+        # flush any debounced journal save before the window goes away; the atexit hook
+        # covers exits that skip the window close (one hook for whoever is logged in)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        atexit.register(self._flush_current_user)
+
+        # screens are built once, stacked in the same grid cell of one container and
+        # switched with tkraise(); name -> (builder, hook run every time the screen is shown)
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        self._root_container = self._make_root_container()
+        self._screens = {}
+        self._screen_specs = {
+            "login": (self._build_login_screen, None),
+            "home": (self._build_home_screen, self._refresh_home_screen),
+            "mood": (self._build_mood_screen, self._reset_mood_screen),
+            "relationship": (self._build_relationship_screen, self._reset_relationship_screen),
+            "red_flag": (self._build_red_flag_screen, self._reset_red_flag_screen),
+            "journal": (self._build_journal_screen, self._reset_journal_screen),
+            "affirmations": (self._build_affirmation_screen, self._reset_affirmation_screen),
+            "journey": (self._build_journey_screen, self._reset_journey_screen),
+        }
+        self._current_screen = None
 
         # Build login screen
-        self._build_login_screen()
-
-    # helper: create styled buttons with thin border and attractive color
-    def _make_button(self, parent, text, cmd, bg=None, width=None, height=None, padx=10, pady=6):
-        pastel_blue = "#D6EEFF"
-        deep_blue = "#1E3A8A"
-        btn_bg = pastel_blue
-        kwargs = {"bg": btn_bg, "command": cmd, "bd": 1, "relief": "solid", "highlightthickness": 1, "highlightbackground": "#9ED0FF", "activebackground": btn_bg, "padx": padx, "pady": pady, "fg": deep_blue, "font": ("Poppins", 12, "bold")}
-        if width is not None:
-            kwargs["width"] = width
-        if height is not None:
-            kwargs["height"] = height
-        return tk.Button(parent, text=text, **kwargs)
-
-    # helper: add placeholder behavior to Entry widgets
-    def _add_placeholder(self, entry: tk.Entry, placeholder: str, active_fg="#E05F7D"):
-        placeholder_color = "#BEBEBE"
-        try:
-            entry.insert(0, placeholder)
-            entry.config(fg=placeholder_color)
-        except Exception:
-            pass
+        self._show_screen("login")
 
-        def on_focus_in(event):
-            if entry.get() == placeholder:
-                entry.delete(0, 'end')
-                entry.config(fg=active_fg)
+    # providers: nothing needs them before login, so build them lazily
+    @cached_property
+    def daily_provider(self):
+        return DailyAffirmationProvider(AFFIRMATIONS)
 
-        def on_focus_out(event):
-            if not entry.get():
-                entry.insert(0, placeholder)
-                entry.config(fg=placeholder_color)
-
-        entry.bind('<FocusIn>', on_focus_in)
-        entry.bind('<FocusOut>', on_focus_out)
-
-    def _sub_partner(self, text: str) -> str:
-        try:
-            partner = self.current_user.partner
-        except Exception:
-            partner = None
-        if partner and partner.strip() and partner != "Nama pasangan (opsional)...":
-            return text.replace('pasanganmu', f"'{partner}'").replace('pasangan', f"'{partner}'")
-        return text
-
-    # ---------- UI BUILDERS ----------
-    def _build_login_screen(self):
-        self.clear_window()
-        frame = tk.Frame(self, bg="#FFF4F7")
-        frame.pack(expand=True)
-
-        title = tk.Label(frame, text="Welcome to MineBloom", font=("Poppins", 44, "bold"), bg="#FFF4F7", fg="#E05F7D")
-        title.pack(pady=10)
-
-        subtitle = tk.Label(frame, text="Hi Mine... Kamu aman di sini 🤍", font=("Quicksand", 14), bg="#FFF4F7", fg="#8B6C8E")
-        subtitle.pack(pady=6)
-
-        form = tk.Frame(frame, bg="#FFF4F7")
-        form.pack(pady=20)
-
-        tk.Label(form, text="Nama Kamu:", bg="#FFF4F7", fg="#E05F7D", font=("Quicksand", 12, "bold")).grid(row=0, column=0, sticky="e", padx=6, pady=6)
-        username_entry = tk.Entry(form, width=30, bg="#FFFFFF", fg="#E05F7D", insertbackground="#E05F7D", relief="solid", bd=1)
-        username_entry.grid(row=0, column=1, pady=6)
-        self._add_placeholder(username_entry, "Masukkan nama kamu...")
-
-        tk.Label(form, text="Nama Pasangan (opsional):", bg="#FFF4F7", fg="#E05F7D", font=("Quicksand", 12, "bold")).grid(row=1, column=0, sticky="e", padx=6, pady=6)
-        partner_entry = tk.Entry(form, width=30, bg="#FFFFFF", fg="#E05F7D", insertbackground="#E05F7D", relief="solid", bd=1)
-        partner_entry.grid(row=1, column=1, pady=6)
-        self._add_placeholder(partner_entry, "Nama pasangan (opsional)...")
-
-        def do_login():
-            uname = username_entry.get().strip()
-            partner = partner_entry.get().strip()
-            if not uname or uname == "Masukkan nama kamu...":
-                messagebox.showwarning("Input Dibutuhkan", "Masukkan nama kamu dulu ya sayang.")
-                return
-            self.current_user = User(uname, partner)
-            if partner and partner != "Nama pasangan (opsional)...":
-                self.current_user.set_journal_password(partner)
-            else:
-                self.current_user.set_journal_password("mine123")
-            self._build_home_screen()
-
-        login_btn = self._make_button(frame, text="Masuk", cmd=do_login, bg="#FF8FB3", padx=20, pady=8)
-        login_btn.pack(pady=12)
-
-    # Remaining UI methods are defined further down in the file (kept as before)
+    @cached_property
+    def random_provider(self):
+        return RandomAffirmationProvider(AFFIRMATIONS)
 
     # helper: create styled buttons with thin border and attractive color
     def _make_button(self, parent, text, cmd, bg=None, width=None, height=None, padx=10, pady=6):
         # unify button look: pastel blue background, deep-sky blue text, aesthetic font
-        pastel_blue = "#D6EEFF"
-        deep_blue = "#1E3A8A"
-        # enforce pastel-blue buttons and deep-blue text for a unified look
-        btn_bg = pastel_blue if bg is None else bg
-        kwargs = {"bg": btn_bg, "command": cmd, "bd": 1, "relief": "solid", "highlightthickness": 1, "highlightbackground": "#9ED0FF", "activebackground": btn_bg, "padx": padx, "pady": pady, "fg": deep_blue, "font": ("Poppins", 12, "bold")}
+        kwargs = {**_BUTTON_DEFAULTS, "command": cmd, "padx": padx, "pady": pady, "font": self.fonts["button"]}
+        if bg is not None:
+            kwargs["bg"] = kwargs["activebackground"] = bg
         if width is not None:
             kwargs["width"] = width
         if height is not None:
@@ -277,61 +687,110 @@ class MineBloomApp(tk.Tk):
         return tk.Button(parent, text=text, **kwargs)
 
     # helper: add placeholder behavior to Entry widgets
-    def _add_placeholder(self, entry: tk.Entry, placeholder: str, active_fg="#E05F7D"):
-        placeholder_color = "#BEBEBE"
+    def _add_placeholder(self, entry, placeholder: str, active_fg="#E05F7D"):
+        # the focus handlers are bound once on the "Placeholder" tag (see __init__);
+        # each entry only carries its own placeholder text and colour
+        entry.placeholder = placeholder
+        entry.placeholder_active_fg = active_fg
         try:
             entry.insert(0, placeholder)
-            entry.config(fg=placeholder_color)
+            entry.config(foreground=self._PLACEHOLDER_FG)
         except Exception:
             pass
-
-        def on_focus_in(event):
-            if entry.get() == placeholder:
-                entry.delete(0, 'end')
-                entry.config(fg=active_fg)
-
-        def on_focus_out(event):
-            if not entry.get():
-                entry.insert(0, placeholder)
-                entry.config(fg=placeholder_color)
-
-        entry.bind('<FocusIn>', on_focus_in)
-        entry.bind('<FocusOut>', on_focus_out)
+        entry.bindtags(("Placeholder",) + entry.bindtags())
+
+    def _placeholder_focus_in(self, event):
+        entry = event.widget
+        if entry.get() == entry.placeholder:
+            entry.delete(0, 'end')
+            entry.config(foreground=entry.placeholder_active_fg)
+
+    def _placeholder_focus_out(self, event):
+        entry = event.widget
+        if not entry.get():
+            entry.insert(0, entry.placeholder)
+            entry.config(foreground=self._PLACEHOLDER_FG)
+
+    def _reset_placeholder(self, entry, placeholder: str):
+        # put a reused Entry back into its initial "placeholder shown" state
+        entry.delete(0, 'end')
+        entry.insert(0, placeholder)
+        entry.config(foreground=self._PLACEHOLDER_FG)
 
     def _sub_partner(self, text: str) -> str:
         # replace occurrences of the word 'pasangan' with the partner's name in quotes, if provided
-        try:
-            partner = self.current_user.partner
-        except Exception:
-            partner = None
-        if partner and partner.strip() and partner != "Nama pasangan (opsional)...":
-            return text.replace('pasanganmu', f"'{partner}'").replace('pasangan', f"'{partner}'")
+        # (whether a partner is set is decided once at login, see _set_partner_substitution)
+        if self._partner_sub_active:
+            return self._PARTNER_RE.sub(self._partner_quoted, text)
         return text
 
+    def _set_partner_substitution(self, partner):
+        self._partner_sub_active = bool(partner and partner.strip() and partner != "Nama pasangan (opsional)...")
+        # used as a re.sub template, so backslashes in the name must be escaped
+        self._partner_quoted = f"'{partner}'".replace('\\', '\\\\')
+
+    def _schedule_text(self, widget, text):
+        # coalesce rapid label updates: only the last text per widget is applied, once per idle pass
+        self._pending_text[widget] = text
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_pending_texts)
+
+    def _flush_pending_texts(self):
+        pending, self._pending_text = self._pending_text, {}
+        self._flush_scheduled = False
+        for widget, text in pending.items():
+            try:
+                widget.config(text=text)
+            except tk.TclError:
+                # the screen was destroyed (e.g. logout) before the idle pass ran
+                pass
+
+    def _set_spinbox(self, spinbox: tk.Spinbox, value):
+        spinbox.delete(0, 'end')
+        spinbox.insert(0, value)
+
+    # ---------- Screen management ----------
+    def _show_screen(self, name: str):
+        """Raise the screen `name`, building it the first time it is needed."""
+        screen = self._screens.get(name)
+        builder, on_show = self._screen_specs[name]
+        if screen is None:
+            screen = tk.Frame(self._root_container, bg="#FFF4F7")
+            screen.grid(row=0, column=0, sticky="nsew")
+            builder(screen)
+            self._screens[name] = screen
+        if on_show is not None:
+            on_show()
+        screen.tkraise()
+        # move keyboard focus off widgets of the previous screen
+        screen.focus_set()
+        self._current_screen = name
+
+    def _go_home(self):
+        self._show_screen("home")
+
     # ---------- UI BUILDERS ----------
-    def _build_login_screen(self):
-        self.clear_window()
-        frame = tk.Frame(self, bg="#FFF4F7")
+    def _build_login_screen(self, screen):
+        frame = ttk.Frame(screen, style="Mine.TFrame")
         frame.pack(expand=True)
 
-        title = tk.Label(frame, text="Welcome to MineBloom", font=("Poppins", 44, "bold"),
-                 bg="#FFF4F7", fg="#E05F7D")
+        title = ttk.Label(frame, text="Welcome to MineBloom", style="Mine.Title.TLabel")
         title.pack(pady=10)
 
-        subtitle = tk.Label(frame, text="Hi Mine... Kamu aman di sini 🤍", font=("Quicksand", 14),
-                    bg="#FFF4F7", fg="#8B6C8E")
+        subtitle = ttk.Label(frame, text="Hi Mine... Kamu aman di sini 🤍", style="Mine.Subtitle.TLabel")
         subtitle.pack(pady=6)
 
-        form = tk.Frame(frame, bg="#FFF4F7")
+        form = ttk.Frame(frame, style="Mine.TFrame")
         form.pack(pady=20)
 
-        tk.Label(form, text="Nama Kamu:", bg="#FFF4F7", fg="#E05F7D", font=("Quicksand", 12, "bold")).grid(row=0, column=0, sticky="e", padx=6, pady=6)
-        username_entry = tk.Entry(form, width=30, bg="#FFFFFF", fg="#E05F7D", insertbackground="#E05F7D", relief="solid", bd=1)
+        ttk.Label(form, text="Nama Kamu:", style="Mine.TLabel").grid(row=0, column=0, sticky="e", padx=6, pady=6)
+        username_entry = ttk.Entry(form, width=30, style="Mine.TEntry")
         username_entry.grid(row=0, column=1, pady=6)
         self._add_placeholder(username_entry, "Masukkan nama kamu...")
 
-        tk.Label(form, text="Nama Pasangan (opsional):", bg="#FFF4F7", fg="#E05F7D", font=("Quicksand", 12, "bold")).grid(row=1, column=0, sticky="e", padx=6, pady=6)
-        partner_entry = tk.Entry(form, width=30, bg="#FFFFFF", fg="#E05F7D", insertbackground="#E05F7D", relief="solid", bd=1)
+        ttk.Label(form, text="Nama Pasangan (opsional):", style="Mine.TLabel").grid(row=1, column=0, sticky="e", padx=6, pady=6)
+        partner_entry = ttk.Entry(form, width=30, style="Mine.TEntry")
         partner_entry.grid(row=1, column=1, pady=6)
         self._add_placeholder(partner_entry, "Nama pasangan (opsional)...")
 
@@ -341,55 +800,45 @@ class MineBloomApp(tk.Tk):
             if not uname or uname == "Masukkan nama kamu...":
                 messagebox.showwarning("Input Dibutuhkan", "Masukkan nama kamu dulu ya sayang.")
                 return
-            self.current_user = User(uname, partner)
+            # save what the previous user still has pending before dropping them
+            self._flush_current_user()
+            self.current_user = User(uname, partner, scheduler=self)
+            self._set_partner_substitution(partner)
             # set journal password to partner's name if provided, else keep a fallback
             if partner and partner != "Nama pasangan (opsional)...":
                 self.current_user.set_journal_password(partner)
             else:
                 self.current_user.set_journal_password("mine123")
-            self._build_home_screen()
+            # screens cached for a previous user must not leak into this session
+            self.clear_window()
+            self._go_home()
 
         login_btn = self._make_button(frame, text="Masuk", cmd=do_login, bg="#FF8FB3", padx=20, pady=8)
         login_btn.pack(pady=12)
 
-    def _build_home_screen(self):
-        self.clear_window()
+    def _build_home_screen(self, screen):
         # Top greeting & automatic affirmation
-        header = tk.Frame(self, bg="#FFF4F7")
+        self._home_texts = (None, None)  # (username, daily affirmation) currently shown
+        header = tk.Frame(screen, bg="#FFF4F7")
         header.pack(fill="x", pady=8, padx=10)
 
-        greeting = tk.Label(header, text=f"Hi {self.current_user.username}… Kamu aman di sini 🤍",
-                            font=("Poppins", 18, "bold"), bg="#FFF4F7", fg="#E05F7D")
-        greeting.pack(side="left")
+        self._greeting_label = tk.Label(header, font=self.fonts["greeting"], bg="#FFF4F7", fg="#E05F7D")
+        self._greeting_label.pack(side="left")
 
         # ornament: small flower on the header (girly vibe)
-        ornament = tk.Label(header, text="🌸", font=("Segoe UI Emoji", 20), bg="#FFF4F7")
+        ornament = tk.Label(header, text="🌸", font=self.fonts["ornament"], bg="#FFF4F7")
         ornament.pack(side="right", padx=8)
 
-        small_info = tk.Label(header, text=f"This Mine space is yours — {self.current_user.username}.",
-                              font=("Quicksand", 10), bg="#FFF4F7", fg="#8B6C8E")
-        small_info.pack(side="left", padx=14)
-
-        # automatic affirmation on login (deep + slightly playful tone)
-        def _friendly_affirmation():
-            base = self.daily_provider.get_affirmation()
-            # add a playful friendly suffix
-            playful = [
-                "Keep going — you've got this (and maybe a cookie).",
-                "You're doing better than you think — tiny victory dance.",
-                "Slow breaths. Tiny wins. Big hugs (figurative).",
-                "Tiny progress is still progress — and very cool. 😌",
-                "You matter — and yes, even on weird days."
-            ]
-            return f"{base} — {random.choice(playful)}"
-
-        auto_aff = _friendly_affirmation()
-        aff_label = tk.Label(self, text=auto_aff, wraplength=760, justify="center",
-                             bg="#FFF4F7", fg="#6B3A50", font=("Quicksand", 12, "italic"))
-        aff_label.pack(pady=6)
+        self._small_info_label = tk.Label(header, font=self.fonts["small"], bg="#FFF4F7", fg="#8B6C8E")
+        self._small_info_label.pack(side="left", padx=14)
+
+        # automatic affirmation on login (deep + slightly playful tone); text set in _refresh_home_screen
+        self._auto_aff_label = tk.Label(screen, wraplength=760, justify="center",
+                                        bg="#FFF4F7", fg="#6B3A50", font=self.fonts["affirmation"])
+        self._auto_aff_label.pack(pady=6)
 
         # Main cards
-        cards = tk.Frame(self, bg="#FFF4F7")
+        cards = tk.Frame(screen, bg="#FFF4F7")
         cards.pack(pady=10)
 
         # left column menu (petal-like)
@@ -413,315 +862,273 @@ class MineBloomApp(tk.Tk):
         right.grid(row=0, column=1, padx=6, sticky="n")
 
         # Daily Reminder (religious reminders replacing the previous boundaries queue)
-        reminder_text = (
-            "1. You are never alone; Allah is always with you.\n"
-            "﴿ فَإِنَّ مَعَ الْعُسْرِ يُسْرًا ۝ إِنَّ مَعَ الْعُسْرِ يُسْرًا ﴾\n"
-            "Surah Al-Inshirah (94): 5–6\n\n"
-            "2. You are strong. Allah never burdens a soul beyond what it can bear.\n"
-            "﴿ لَا يُكَلِّفُ اللَّهُ نَفْسًا إِلَّا وُسْعَهَا ﴾\n"
-            "Surah Al-Baqarah (2): 286\n\n"
-            "3. Trust Allah. What is written for you will always find its way.\n"
-            "﴿ وَمَن يَتَوَكَّلْ عَلَى اللَّهِ فَهُوَ حَسْبُهُ ﴾\n"
-            "Surah At-Talaq (65): 3\n\n"
-            "4. Let your heart rest—peace comes from remembering Allah.\n"
-            "﴿ أَلَا بِذِكْرِ اللَّهِ تَطْمَئِنُّ الْقُلُوبُ ﴾\n"
-            "Surah Ar-Ra‘d (13): 28\n\n"
-            "5. Every step you take to improve yourself, Allah guides you further.\n"
-            "﴿ وَالَّذِينَ جَاهَدُوا فِينَا لَنَهْدِيَنَّهُمْ سُبُلَنَا ﴾\n"
-            "Surah Al-‘Ankabut (29): 69"
-        )
         reminder_card = tk.LabelFrame(right, text="Daily Reminder", bg="#FFF4F7", fg="#E05F7D", padx=10, pady=10)
         reminder_card.pack(pady=8)
-        reminder_label = tk.Label(reminder_card, text=reminder_text, bg="#FFF4F7", fg="#6B3A50", justify="left", wraplength=360, font=("Quicksand", 11))
+        reminder_label = tk.Label(reminder_card, text=REMINDER_TEXT, bg="#FFF4F7", fg="#6B3A50", justify="left", wraplength=360, font=self.fonts["reminder"])
         reminder_label.pack()
 
         # daily affirmation card (from daily provider)
-        daily_aff_text = self.daily_provider.get_affirmation()
         daily_card = tk.LabelFrame(right, text="Daily Affirmation", bg="#FFF4F7", fg="#E05F7D",
                        padx=10, pady=10)
         daily_card.pack(pady=8)
-        self.daily_aff_label = tk.Label(daily_card, text=daily_aff_text, wraplength=300, bg="#FFF4F7", fg="#E05F7D", font=("Poppins", 14, "bold"))
+        self.daily_aff_label = tk.Label(daily_card, wraplength=300, bg="#FFF4F7", fg="#E05F7D", font=self.fonts["daily"])
         self.daily_aff_label.pack()
 
         # Random quick affirmation button
         rand_btn = self._make_button(right, text="Get Random Affirmation", cmd=self._show_random_affirmation, bg="#FFD6E8")
         rand_btn.pack(pady=6)
 
+    def _today_affirmation(self):
+        # one provider call per day per session; every card shows the same daily string
+        today = datetime.date.today()
+        if self._daily_aff_cache[0] != today:
+            self._daily_aff_cache = (today, self.daily_provider.get_affirmation())
+        return self._daily_aff_cache[1]
+
+    def _friendly_affirmation(self):
+        base = self._today_affirmation()
+        # add a playful friendly suffix
+        return f"{base} — {_choice(PLAYFUL_SUFFIXES)}"
+
+    def _refresh_home_screen(self):
+        # only the dynamic texts change; the widgets themselves are reused and
+        # labels whose text is unchanged since the last visit are left alone
+        username = self.current_user.username
+        daily = self._today_affirmation()
+        shown_user, shown_daily = self._home_texts
+        if username != shown_user:
+            self._greeting_label.config(text=f"Hi {username}… Kamu aman di sini 🤍")
+            self._small_info_label.config(text=f"This Mine space is yours — {username}.")
+        self._auto_aff_label.config(text=self._friendly_affirmation())
+        if daily != shown_daily:
+            self.daily_aff_label.config(text=daily)
+        self._home_texts = (username, daily)
+
     # ---------- Feature screens ----------
     def _open_mood_tracker(self):
-        self.clear_window()
-        frame = tk.Frame(self, bg="#FFF4F7")
+        self._show_screen("mood")
+
+    def _build_mood_screen(self, screen):
+        frame = tk.Frame(screen, bg="#FFF4F7")
         frame.pack(fill="both", expand=True, padx=12, pady=12)
 
-        tk.Label(frame, text="My Mood Blossom Tracker", font=("Poppins", 16, "bold"), bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
+        tk.Label(frame, text="My Mood Blossom Tracker", font=self.fonts["heading"], bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
         # mood scale (1-5)
         mood_frame = tk.Frame(frame, bg="#FFF4F7")
         mood_frame.pack(pady=8)
-        tk.Label(mood_frame, text="Pilih mood hari ini:", bg="#FFF4F7", fg="#E05F7D", font=("Quicksand", 12, "bold")).grid(row=0, column=0, columnspan=6, sticky="w")
-        mood_var = tk.IntVar(value=3)
+        tk.Label(mood_frame, text="Pilih mood hari ini:", bg="#FFF4F7", fg="#E05F7D", font=self.fonts["label"]).grid(row=0, column=0, columnspan=6, sticky="w")
+        self._mood_var = tk.IntVar(value=3)
         # emoji labels for mood (extended) arranged in two rows to avoid stacking
-        emojis = ["😢","😕","😐","🙂","😄","😂","🥰","😇","✨","🫶🏻","💸"]
-        cols = 6
-        for idx, em in enumerate(emojis):
-            r = (idx // cols) + 1
-            c = idx % cols
-            rb = tk.Radiobutton(mood_frame, text=em, variable=mood_var, value=idx+1, bg="#FFF4F7", font=("Segoe UI Emoji", 60))
-            rb.grid(row=r, column=c, padx=8, pady=6)
-
-        tk.Label(frame, text="Catatan singkat (opsional):", bg="#FFF4F7", fg="#E05F7D", font=("Quicksand", 12, "bold")).pack(anchor="w", pady=(12,0))
-        note_entry = tk.Entry(frame, width=70, bg="#FFF7D6", fg="#E05F7D", insertbackground="#E05F7D", relief="solid", bd=1)
-        note_entry.pack(pady=6)
-        self._add_placeholder(note_entry, "Tulis catatan singkat...")
-
-        # Time recorder for mood entry (hour:minute)
+        emoji_font = self.fonts["mood_emoji"]
+        mood_var = self._mood_var
+        for idx, em in enumerate(EMOJIS):
+            r, c = divmod(idx, 6)
+            tk.Radiobutton(mood_frame, text=em, variable=mood_var, value=idx+1, bg="#FFF4F7",
+                           font=emoji_font).grid(row=r+1, column=c, padx=8, pady=6)
+
+        tk.Label(frame, text="Catatan singkat (opsional):", bg="#FFF4F7", fg="#E05F7D", font=self.fonts["label"]).pack(anchor="w", pady=(12,0))
+        self._mood_note_entry = tk.Entry(frame, width=70, bg="#FFF7D6", fg="#E05F7D", insertbackground="#E05F7D", relief="solid", bd=1)
+        self._mood_note_entry.pack(pady=6)
+        self._add_placeholder(self._mood_note_entry, "Tulis catatan singkat...")
+
+        # Time recorder for mood entry (hour:minute); values are set in _reset_mood_screen
         time_frame = tk.Frame(frame, bg="#FFF4F7")
         time_frame.pack(pady=(6,0), anchor='w')
-        now = datetime.datetime.now()
         tk.Label(time_frame, text="Jam:", bg="#FFF4F7", fg="#E05F7D").pack(side='left')
-        hour_sb = tk.Spinbox(time_frame, from_=0, to=23, width=3)
-        hour_sb.delete(0, 'end')
-        hour_sb.insert(0, f"{now.hour:02d}")
-        hour_sb.pack(side='left', padx=(4,6))
+        self._mood_hour_sb = tk.Spinbox(time_frame, from_=0, to=23, width=3)
+        self._mood_hour_sb.pack(side='left', padx=(4,6))
         tk.Label(time_frame, text=":", bg="#FFF4F7", fg="#E05F7D").pack(side='left')
-        min_sb = tk.Spinbox(time_frame, from_=0, to=59, width=3)
-        min_sb.delete(0, 'end')
-        min_sb.insert(0, f"{now.minute:02d}")
-        min_sb.pack(side='left', padx=(2,4))
-
-        # button actions
-        def save_mood():
-            mood = mood_var.get()
-            note = note_entry.get().strip()
-            # build datetime from time spinboxes (use today's date)
-            try:
-                h = int(hour_sb.get())
-                mi = int(min_sb.get())
-                now = datetime.datetime.now()
-                entry_dt = datetime.datetime(now.year, now.month, now.day, h, mi)
-            except Exception:
-                entry_dt = datetime.datetime.now()
-            entry = {"date": entry_dt, "mood": mood, "note": note}
-            self.stack.push(entry)
-            # If/else untuk pesan afirmasi berdasarkan mood
-            if mood >= 4:
-                msg = "Kamu sudah melakukan hari ini dengan sangat baik. Istirahatlah untuk hadapi hari esok yang ceria 💖"
-            elif mood == 3:
-                msg = "Kamu melakukan yang terbaik hari ini — beri dirimu istirahat ya."
-            else:
-                msg = "Terima kasih karena sudah bertahan hari ini. Istirahat dulu, besok coba lagi."
-            # plus additional affirmation from daily provider
-            extra = self.daily_provider.get_affirmation()
-            messagebox.showinfo("Mood Tersimpan", f"{msg}\n\nAffirmation: {extra}")
-            # also save mood as a journal entry into user's passed journey
-            try:
-                emoji = emojis[mood-1]
-            except Exception:
-                emoji = str(mood)
-            mood_content = f"Mood: {emoji} ({mood})\n{note}"
-            self.current_user.add_journal_entry(mood_content, date=entry_dt)
-            note_entry.delete(0, 'end')
-            self._build_home_screen()
+        self._mood_min_sb = tk.Spinbox(time_frame, from_=0, to=59, width=3)
+        self._mood_min_sb.pack(side='left', padx=(2,4))
 
-        btn_save = self._make_button(frame, text="Simpan", cmd=save_mood)
+        btn_save = self._make_button(frame, text="Simpan", cmd=self._save_mood)
         btn_save.pack(pady=8)
 
-        back_btn = self._make_button(frame, text="Kembali ke Home", cmd=self._build_home_screen)
+        back_btn = self._make_button(frame, text="Kembali ke Home", cmd=self._go_home)
         back_btn.pack(pady=12)
 
+    def _reset_mood_screen(self):
+        self._mood_var.set(3)
+        self._reset_placeholder(self._mood_note_entry, "Tulis catatan singkat...")
+        now = datetime.datetime.now()
+        self._set_spinbox(self._mood_hour_sb, f"{now.hour:02d}")
+        self._set_spinbox(self._mood_min_sb, f"{now.minute:02d}")
+
+    def _save_mood(self):
+        mood = self._mood_var.get()
+        note = self._mood_note_entry.get().strip()
+        # build datetime from time spinboxes (use today's date)
+        try:
+            h = int(self._mood_hour_sb.get())
+            mi = int(self._mood_min_sb.get())
+            now = datetime.datetime.now()
+            entry_dt = datetime.datetime(now.year, now.month, now.day, h, mi)
+        except Exception:
+            entry_dt = datetime.datetime.now()
+        entry = {"date": entry_dt, "mood": mood, "note": note}
+        self.stack.push(entry)
+        # If/else untuk pesan afirmasi berdasarkan mood
+        if mood >= 4:
+            msg = "Kamu sudah melakukan hari ini dengan sangat baik. Istirahatlah untuk hadapi hari esok yang ceria 💖"
+        elif mood == 3:
+            msg = "Kamu melakukan yang terbaik hari ini — beri dirimu istirahat ya."
+        else:
+            msg = "Terima kasih karena sudah bertahan hari ini. Istirahat dulu, besok coba lagi."
+        # plus additional affirmation from daily provider
+        extra = self._today_affirmation()
+        messagebox.showinfo("Mood Tersimpan", f"{msg}\n\nAffirmation: {extra}")
+        # also save mood as a journal entry into user's passed journey
+        emoji = EMOJIS[mood-1] if 0 < mood <= len(EMOJIS) else str(mood)
+        mood_content = f"Mood: {emoji} ({mood})\n{note}"
+        self.current_user.add_journal_entry(mood_content, date=entry_dt)
+        self._mood_note_entry.delete(0, 'end')
+        self._go_home()
+
     def _open_relationship_scan(self):
-        self.clear_window()
-        frame = tk.Frame(self, bg="#FFF4F7")
+        self._show_screen("relationship")
+
+    def _build_relationship_screen(self, screen):
+        frame = tk.Frame(screen, bg="#FFF4F7")
         frame.pack(fill="both", expand=True, padx=12, pady=12)
-        tk.Label(frame, text="My Relationship Scan", font=("Poppins", 16, "bold"), bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
-
-        # generate 50 relationship questions and show them one-by-one
-        base_questions = [
-            "Apakah pasanganmu mendukung impianmu?",
-            "Apakah pasangan menghargai perasaanmu?",
-            "Apakah komunikasi berjalan terbuka?",
-            "Apakah ada pengendalian berlebih dari pasangan?",
-            "Apakah pasangan mau minta maaf saat salah?",
-            "Apakah kalian bisa berbagi tanggung jawab?",
-            "Apakah pasangan mendengarkan ketika kamu butuh bicara?",
-            "Apakah kamu merasa dihargai?",
-            "Apakah ada rasa aman bersama pasangan?",
-            "Apakah pasangan mendukung waktu pribadimu?",
-            "Apakah pasangan menghormati batasanmu?",
-            "Apakah konflik bisa diselesaikan dengan sehat?",
-            "Apakah pasangan menunjukkan empati?",
-            "Apakah pasangan memberimu ruang untuk tumbuh?",
-            "Apakah pasangan terbuka soal perasaannya?",
-            "Apakah pasangan mengapresiasi usahamu?",
-            "Apakah hubungan kalian memberi rasa tenang?",
-            "Apakah keputusan penting dibicarakan bersama?",
-            "Apakah pasangan memberi dukungan emosional?",
-            "Apakah ada kejujuran dalam hubungan?",
-            "Apakah pasangan menghargai keluargamu?",
-            "Apakah ada toleransi terhadap perbedaan?",
-            "Apakah pasangan menjaga komitmen?",
-            "Apakah pasangan mendorong kemandirianmu?",
-            "Apakah pasangan hadir saat kamu butuh?",
-            "Apakah komunikasi non-verbal terasa nyaman?",
-            "Apakah pasangan menerima kekuranganmu?",
-            "Apakah pasangan menyemangati mimpimu?",
-            "Apakah pasangan mendukung kesehatan mentalmu?",
-            "Apakah ada saling berbagi kegembiraan?",
-            "Apakah pasangan menghindari perilaku merendahkan?",
-            "Apakah pasangan memberi ruang untuk hobi?",
-            "Apakah ada rasa saling percaya?",
-            "Apakah pasangan bertanggung jawab secara finansial bersama?",
-            "Apakah pasangan menghormati privasimu?",
-            "Apakah pasangan membantu saat kamu lelah?",
-            "Apakah pasangan menunjukkan rasa terima kasih?",
-            "Apakah pasangan menghindari manipulasi emosional?",
-            "Apakah ada upaya memperbaiki saat salah?",
-            "Apakah hubungan memberikan energi positif?",
-            "Apakah pasangan memberi umpan balik yang membangun?",
-            "Apakah pasangan menghormati pendapatmu?",
-            "Apakah ada rasa aman dalam berbagi rahasia?",
-            "Apakah pasangan menepati janji?",
-            "Apakah kalian menikmati waktu berkualitas bersama?",
-            "Apakah pasangan peka terhadap kebutuhanmu?",
-            "Apakah ada kemauan berkembang bersama?",
-            "Apakah pasangan mendukung keputusan kariermu?",
-            "Apakah komunikasi tetap hangat meski sibuk?"
-        ]
-        # ensure at least 50 questions
-        questions = []
-        i = 0
-        while len(questions) < 50:
-            q = base_questions[i % len(base_questions)]
-            questions.append(self._sub_partner(q))
-            i += 1
-
-        current_idx = 0
-        set_count = 0
-        set_answers = []
+        tk.Label(frame, text="My Relationship Scan", font=self.fonts["heading"], bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
 
+        # 50 relationship questions are shown one-by-one, see _reset_relationship_screen
         q_frame = tk.Frame(frame, bg="#FFF4F7")
         q_frame.pack(fill="both", expand=True)
 
-        q_label = tk.Label(q_frame, text=questions[current_idx], bg="#FFF7D6", fg="#E05F7D", wraplength=700, font=("Quicksand", 14, "bold"))
-        q_label.pack(pady=20, padx=12)
+        self._rel_q_label = tk.Label(q_frame, bg="#FFF7D6", fg="#E05F7D", wraplength=700, font=self.fonts["question"])
+        self._rel_q_label.pack(pady=20, padx=12)
 
         # answer buttons
-        def submit_answer(ans):
-            nonlocal current_idx, set_count, set_answers
-            set_answers.append(1 if ans else 0)
-            set_count += 1
-            current_idx += 1
-            # if we've answered 10 in this set, show score
-            if set_count >= 10 or current_idx >= len(questions):
-                score = sum(set_answers)
-                # build a short summary of the 10-question set and save to journal
-                try:
-                    start_idx = current_idx - len(set_answers)
-                    qs = questions[start_idx:current_idx]
-                    summary_lines = []
-                    for i, (qtext, ans_val) in enumerate(zip(qs, set_answers), start=1):
-                        summary_lines.append(f"{i}. {qtext} — {('Ya' if ans_val==1 else 'Tidak')}")
-                    content = f"Relationship Scan — Score {score}/{len(set_answers)}\n" + "\n".join(summary_lines)
-                    self.current_user.add_journal_entry(content, date=datetime.datetime.now())
-                except Exception:
-                    # best-effort: still show score even if save fails
-                    pass
-                messagebox.showinfo("Skor Relationship", f"Skor Anda untuk 10 pertanyaan ini: {score} dari {len(set_answers)}\n\nHasil telah disimpan di My Passed Journey.")
-                # offer to continue to next 10 or finish
-                if current_idx < len(questions):
-                    if messagebox.askyesno("Lanjut", "Lanjut ke 10 pertanyaan berikutnya?"):
-                        # reset set counters and show next question
-                        set_count = 0
-                        set_answers = []
-                        q_label.config(text=questions[current_idx])
-                        return
-                # otherwise finish and go back
-                self._build_home_screen()
-                return
-            # otherwise, show next question
-            q_label.config(text=questions[current_idx])
-
         btns = tk.Frame(q_frame, bg="#FFF4F7")
         btns.pack(pady=8)
-        yes_btn = self._make_button(btns, text="✔️ Ya", cmd=lambda: submit_answer(True), bg="#FFB6D0", width=12)
+        yes_btn = self._make_button(btns, text="✔️ Ya", cmd=lambda: self._submit_relationship_answer(True), bg="#FFB6D0", width=12)
         yes_btn.pack(side="left", padx=12)
-        no_btn = self._make_button(btns, text="❌ Tidak", cmd=lambda: submit_answer(False), bg="#FFD6E8", width=12)
+        no_btn = self._make_button(btns, text="❌ Tidak", cmd=lambda: self._submit_relationship_answer(False), bg="#FFD6E8", width=12)
         no_btn.pack(side="left", padx=12)
 
-        back_btn = self._make_button(frame, text="Kembali", cmd=self._build_home_screen)
+        back_btn = self._make_button(frame, text="Kembali", cmd=self._go_home)
         back_btn.pack(pady=12)
 
+    def _reset_relationship_screen(self):
+        # substituted questions only depend on the partner name, so cache them per partner
+        partner = self.current_user.partner
+        if self._rel_questions_cache[0] != partner:
+            subbed = [self._sub_partner(q) for q in _RELATIONSHIP_QUESTIONS]
+            # repeat the list to get at least 50 questions
+            questions = (subbed * (50 // len(subbed) + 1))[:50]
+            self._rel_questions_cache = (partner, questions)
+        questions = self._rel_questions = self._rel_questions_cache[1]
+        self._rel_idx = 0
+        self._rel_set_count = 0
+        self._rel_set_answers = []
+        self._schedule_text(self._rel_q_label, questions[0])
+
+    def _submit_relationship_answer(self, ans):
+        questions = self._rel_questions
+        self._rel_set_answers.append(1 if ans else 0)
+        self._rel_set_count += 1
+        self._rel_idx += 1
+        current_idx = self._rel_idx
+        set_answers = self._rel_set_answers
+        # if we've answered 10 in this set, show score
+        if self._rel_set_count >= 10 or current_idx >= len(questions):
+            score = sum(set_answers)
+            # build a short summary of the 10-question set and save to journal
+            try:
+                start_idx = current_idx - len(set_answers)
+                qs = questions[start_idx:current_idx]
+                content = f"Relationship Scan — Score {score}/{len(set_answers)}\n" + "\n".join(
+                    f"{i}. {qtext} — {('Ya' if ans_val==1 else 'Tidak')}"
+                    for i, (qtext, ans_val) in enumerate(zip(qs, set_answers), start=1))
+                self.current_user.add_journal_entry(content, date=datetime.datetime.now())
+            except Exception:
+                # best-effort: still show score even if save fails
+                pass
+            messagebox.showinfo("Skor Relationship", f"Skor Anda untuk 10 pertanyaan ini: {score} dari {len(set_answers)}\n\nHasil telah disimpan di My Passed Journey.")
+            # offer to continue to next 10 or finish
+            if current_idx < len(questions):
+                if messagebox.askyesno("Lanjut", "Lanjut ke 10 pertanyaan berikutnya?"):
+                    # reset set counters and show next question
+                    self._rel_set_count = 0
+                    self._rel_set_answers = []
+                    self._schedule_text(self._rel_q_label, questions[current_idx])
+                    return
+            # otherwise finish and go back
+            self._go_home()
+            return
+        # otherwise, show next question
+        self._schedule_text(self._rel_q_label, questions[current_idx])
+
     def _open_red_flag_detector(self):
-        self.clear_window()
-        frame = tk.Frame(self, bg="#FFF4F7")
+        self._show_screen("red_flag")
+
+    def _build_red_flag_screen(self, screen):
+        frame = tk.Frame(screen, bg="#FFF4F7")
         frame.pack(fill="both", expand=True, padx=12, pady=12)
 
-        tk.Label(frame, text="My Red-Flag Checker", font=("Poppins", 16, "bold"), bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
-        items = [
-            self._sub_partner("Sering mengontrol apa yg kamu lakukan?"),
-            self._sub_partner("Sering menyalahkanmu atas segala hal?"),
-            self._sub_partner("Meminta isolasi dari teman/keluarga?"),
-            self._sub_partner("Tidak pernah bertanggung jawab atas perilaku buruk?"),
-            self._sub_partner("Ada ancaman atau intimidasi?")
-        ]
-        answers = []
-        idx = tk.IntVar(value=0)
+        tk.Label(frame, text="My Red-Flag Checker", font=self.fonts["heading"], bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
+        self._rf_idx = 0  # plain int: no widget is bound to the question index
 
         q_frame = tk.Frame(frame, bg="#FFF4F7")
         q_frame.pack(pady=8)
         canvas_w, canvas_h = 760, 120
-        q_canvas = tk.Canvas(q_frame, width=canvas_w, height=canvas_h, bg="#FFF4F7", highlightthickness=0)
+        q_canvas = self._rf_canvas = tk.Canvas(q_frame, width=canvas_w, height=canvas_h, bg="#FFF4F7", highlightthickness=0)
         q_canvas.pack()
-
-        def draw_question(text):
-            q_canvas.delete("all")
-            x1, y1, x2, y2 = 10, 10, canvas_w - 10, canvas_h - 10
-            r = 20
-            q_canvas.create_arc(x1, y1, x1 + 2 * r, y1 + 2 * r, start=90, extent=90, fill="#FFF7D6", outline="#FFF7D6")
-            q_canvas.create_arc(x2 - 2 * r, y1, x2, y1 + 2 * r, start=0, extent=90, fill="#FFF7D6", outline="#FFF7D6")
-            q_canvas.create_arc(x1, y2 - 2 * r, x1 + 2 * r, y2, start=180, extent=90, fill="#FFF7D6", outline="#FFF7D6")
-            q_canvas.create_arc(x2 - 2 * r, y2 - 2 * r, x2, y2, start=270, extent=90, fill="#FFF7D6", outline="#FFF7D6")
-            q_canvas.create_rectangle(x1 + r, y1, x2 - r, y2, fill="#FFF7D6", outline="#FFF7D6")
-            q_canvas.create_rectangle(x1, y1 + r, x2, y2 - r, fill="#FFF7D6", outline="#FFF7D6")
-            q_canvas.create_text(canvas_w // 2, canvas_h // 2, text=text, width=canvas_w - 60, fill="#E05F7D", font=("Quicksand", 14, "bold"))
-
-        draw_question(items[0])
-
-        def ans_yes():
-            answers.append(1)
-            next_q()
-
-        def ans_no():
-            answers.append(0)
-            next_q()
-
-        def next_q():
-            i = idx.get()
-            i += 1
-            if i < len(items):
-                idx.set(i)
-                draw_question(items[i])
-            else:
-                count = sum(answers)
-                if count == 0:
-                    level = "Hijau (Aman)"
-                    suggestion = "Terus pertahankan batas sehat."
-                elif count <= 2:
-                    level = "Kuning (Waspada)"
-                    suggestion = "Waspadai, bicarakan dengan orang terpercaya."
-                else:
-                    level = "Merah (Berisiko)"
-                    suggestion = "Pertimbangkan dukungan profesional dan rencana keselamatan."
-                messagebox.showinfo("Hasil Red-Flag", f"Jumlah tanda: {count}\nLevel: {level}\n\n{suggestion}")
-                self._build_home_screen()
-
-        btn_yes = self._make_button(frame, text="✔️ Ya", cmd=ans_yes, bg="#FFB6D0", width=10)
+        # the rounded card never changes, so draw it once and only swap the question text later
+        x1, y1, x2, y2 = 10, 10, canvas_w - 10, canvas_h - 10
+        r = 20
+        q_canvas.create_arc(x1, y1, x1 + 2 * r, y1 + 2 * r, start=90, extent=90, fill="#FFF7D6", outline="#FFF7D6")
+        q_canvas.create_arc(x2 - 2 * r, y1, x2, y1 + 2 * r, start=0, extent=90, fill="#FFF7D6", outline="#FFF7D6")
+        q_canvas.create_arc(x1, y2 - 2 * r, x1 + 2 * r, y2, start=180, extent=90, fill="#FFF7D6", outline="#FFF7D6")
+        q_canvas.create_arc(x2 - 2 * r, y2 - 2 * r, x2, y2, start=270, extent=90, fill="#FFF7D6", outline="#FFF7D6")
+        q_canvas.create_rectangle(x1 + r, y1, x2 - r, y2, fill="#FFF7D6", outline="#FFF7D6")
+        q_canvas.create_rectangle(x1, y1 + r, x2, y2 - r, fill="#FFF7D6", outline="#FFF7D6")
+        self._qtext_id = q_canvas.create_text(canvas_w // 2, canvas_h // 2, text="", width=canvas_w - 60, fill="#E05F7D", font=self.fonts["question"])
+
+        btn_yes = self._make_button(frame, text="✔️ Ya", cmd=lambda: self._answer_red_flag(1), bg="#FFB6D0", width=10)
         btn_yes.pack(side="left", padx=20, pady=12)
-        btn_no = self._make_button(frame, text="❌ Tidak", cmd=ans_no, bg="#FFD6E8", width=10)
+        btn_no = self._make_button(frame, text="❌ Tidak", cmd=lambda: self._answer_red_flag(0), bg="#FFD6E8", width=10)
         btn_no.pack(side="left", padx=20, pady=12)
 
-        back_btn = self._make_button(frame, text="Kembali", cmd=self._build_home_screen, bg="#D6F0FF")
+        back_btn = self._make_button(frame, text="Kembali", cmd=self._go_home, bg="#D6F0FF")
         back_btn.pack(pady=18)
 
+    def _reset_red_flag_screen(self):
+        partner = getattr(self.current_user, 'partner', None)
+        if self._red_flag_cache[0] != partner:
+            self._red_flag_cache = (partner, [self._sub_partner(s) for s in _RED_FLAG_TEMPLATES])
+        self._rf_items = self._red_flag_cache[1]
+        self._rf_answers = []
+        self._rf_idx = 0
+        self._draw_red_flag_question(self._rf_items[0])
+
+    def _draw_red_flag_question(self, text):
+        self._rf_canvas.itemconfigure(self._qtext_id, text=text)
+
+    def _answer_red_flag(self, value):
+        self._rf_answers.append(value)
+        self._rf_idx += 1
+        i = self._rf_idx
+        if i < len(self._rf_items):
+            self._draw_red_flag_question(self._rf_items[i])
+        else:
+            count = sum(self._rf_answers)
+            if count == 0:
+                level = "Hijau (Aman)"
+                suggestion = "Terus pertahankan batas sehat."
+            elif count <= 2:
+                level = "Kuning (Waspada)"
+                suggestion = "Waspadai, bicarakan dengan orang terpercaya."
+            else:
+                level = "Merah (Berisiko)"
+                suggestion = "Pertimbangkan dukungan profesional dan rencana keselamatan."
+            messagebox.showinfo("Hasil Red-Flag", f"Jumlah tanda: {count}\nLevel: {level}\n\n{suggestion}")
+            self._go_home()
+
+    # format of the journal screen's date field
+    _JOURNAL_DATE_FORMAT = "%Y-%m-%d %H:%M"
+
     def _open_healing_journal(self):
         # ask for password (encapsulation)
         pwd = simpledialog.askstring("Journal Password", "Masukkan password jurnal (nama pasangan yang diinput saat login):", show="*")
@@ -731,80 +1138,91 @@ class MineBloomApp(tk.Tk):
         if not partner_name or partner_name.strip() == "" or partner_name == "Nama pasangan (opsional)...":
             messagebox.showerror("Error", "Tidak ada nama pasangan yang diinput saat login. Jurnal hanya dapat dibuka menggunakan nama pasangan sebagai password.")
             return
-        if pwd != partner_name:
+        if not self.current_user.check_journal_password(pwd):
             messagebox.showerror("Error", "Password salah.")
             return
-        self.clear_window()
-        frame = tk.Frame(self, bg="#FFF4F7")
+        self._show_screen("journal")
+
+    def _build_journal_screen(self, screen):
+        frame = tk.Frame(screen, bg="#FFF4F7")
         frame.pack(fill="both", expand=True, padx=12, pady=12)
-        tk.Label(frame, text="My Healing Journal — Mine only", font=("Poppins", 16, "bold"), bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
-        # Date picker (day, month, year) before writing the journal
+        tk.Label(frame, text="My Healing Journal — Mine only", font=self.fonts["heading"], bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
+        # Date and time of the entry as one 'YYYY-MM-DD HH:MM' field; set in _reset_journal_screen
         date_frame = tk.Frame(frame, bg="#FFF4F7")
         date_frame.pack(pady=6)
-        today = datetime.date.today()
-        tk.Label(date_frame, text="Tanggal entri:", bg="#FFF4F7", fg="#E05F7D", font=("Quicksand", 11, "bold")).pack(side="left", padx=(0,6))
-        day_sb = tk.Spinbox(date_frame, from_=1, to=31, width=4)
-        day_sb.delete(0, 'end')
-        day_sb.insert(0, today.day)
-        day_sb.pack(side="left")
-        month_sb = tk.Spinbox(date_frame, from_=1, to=12, width=4)
-        month_sb.delete(0, 'end')
-        month_sb.insert(0, today.month)
-        month_sb.pack(side="left", padx=6)
-        year_sb = tk.Spinbox(date_frame, from_=2000, to=2100, width=6)
-        year_sb.delete(0, 'end')
-        year_sb.insert(0, today.year)
-        year_sb.pack(side="left")
-
-        # Time picker for journal entry
-        time_frame_j = tk.Frame(date_frame, bg="#FFF4F7")
-        time_frame_j.pack(side="left", padx=8)
-        now_dt = datetime.datetime.now()
-        tk.Label(time_frame_j, text="Jam entri:", bg="#FFF4F7", fg="#E05F7D").pack(side="left")
-        hour_sb_j = tk.Spinbox(time_frame_j, from_=0, to=23, width=3)
-        hour_sb_j.delete(0, 'end')
-        hour_sb_j.insert(0, f"{now_dt.hour:02d}")
-        hour_sb_j.pack(side="left", padx=(4,2))
-        tk.Label(time_frame_j, text=":", bg="#FFF4F7", fg="#E05F7D").pack(side="left")
-        min_sb_j = tk.Spinbox(time_frame_j, from_=0, to=59, width=3)
-        min_sb_j.delete(0, 'end')
-        min_sb_j.insert(0, f"{now_dt.minute:02d}")
-        min_sb_j.pack(side="left", padx=(2,4))
+        tk.Label(date_frame, text="Tanggal & jam entri:", bg="#FFF4F7", fg="#E05F7D", font=self.fonts["date_label"]).pack(side="left", padx=(0,6))
+        vcmd = (self.register(self._valid_journal_date_input), '%P')
+        self._journal_date_entry = tk.Entry(date_frame, width=18, validate='key', validatecommand=vcmd)
+        self._journal_date_entry.pack(side="left")
+        self._journal_date_entry.bind('<FocusOut>', self._parse_journal_date)
+        # last parsed field text and its datetime (None if it is not a valid date)
+        self._pending_entry_src = None
+        self._pending_entry_dt = None
+        now_btn = self._make_button(date_frame, text="Now", cmd=self._set_journal_date_now, pady=2)
+        now_btn.pack(side="left", padx=8)
 
         # Journal text area: larger font and pink text color
-        text = tk.Text(frame, width=90, height=18, bg="#FFF4F7", fg="#E05F7D", insertbackground="#E05F7D", font=("Quicksand", 14))
-        text.pack(pady=8)
-        def save_entry():
-            # build date from spinboxes
-            try:
-                d = int(day_sb.get())
-                m = int(month_sb.get())
-                y = int(year_sb.get())
-                h = int(hour_sb_j.get())
-                mi = int(min_sb_j.get())
-                entry_date = datetime.datetime(y, m, d, h, mi)
-            except Exception:
-                entry_date = datetime.datetime.now()
-            content = text.get("1.0", "end").strip()
-            if content:
-                self.current_user.add_journal_entry(content, date=entry_date)
-                messagebox.showinfo("Tersimpan", "Entri jurnal tersimpan.")
-                text.delete("1.0", "end")
-            else:
-                messagebox.showwarning("Kosong", "Isi dulu jurnalnya ya.")
-        save_btn = self._make_button(frame, text="Simpan Entri", cmd=save_entry, bg="#FFB6D0")
+        self._journal_text = tk.Text(frame, width=90, height=18, bg="#FFF4F7", fg="#E05F7D", insertbackground="#E05F7D", font=self.fonts["subtitle"])
+        self._journal_text.pack(pady=8)
+        save_btn = self._make_button(frame, text="Simpan Entri", cmd=self._save_journal_entry, bg="#FFB6D0")
         save_btn.pack(pady=6)
-        back_btn = self._make_button(frame, text="Kembali", cmd=self._build_home_screen, bg="#D6F0FF")
+        back_btn = self._make_button(frame, text="Kembali", cmd=self._go_home, bg="#D6F0FF")
         back_btn.pack(pady=8)
 
+    def _reset_journal_screen(self):
+        self._set_journal_date_now()
+        self._journal_text.delete("1.0", "end")
+
+    def _set_journal_date_now(self):
+        now_dt = datetime.datetime.now().replace(second=0, microsecond=0)
+        raw = now_dt.strftime(self._JOURNAL_DATE_FORMAT)
+        entry = self._journal_date_entry
+        entry.delete(0, 'end')
+        entry.insert(0, raw)
+        # the value is known, no need to parse it back
+        self._pending_entry_src, self._pending_entry_dt = raw, now_dt
+
+    def _parse_journal_date(self, event=None):
+        # parse the date field once per edit: on focus-out, or on save if the text changed since
+        raw = self._journal_date_entry.get().strip()
+        if raw != self._pending_entry_src:
+            self._pending_entry_src = raw
+            try:
+                self._pending_entry_dt = datetime.datetime.strptime(raw, self._JOURNAL_DATE_FORMAT)
+            except ValueError:
+                self._pending_entry_dt = None
+        return self._pending_entry_dt
+
+    @staticmethod
+    def _valid_journal_date_input(proposed):
+        # allow partial input while typing: at most 'YYYY-MM-DD HH:MM' worth of digits and separators
+        return len(proposed) <= 16 and all(ch.isdigit() or ch in "-: " for ch in proposed)
+
+    def _save_journal_entry(self):
+        text = self._journal_text
+        # an incomplete or invalid date falls back to now
+        entry_date = self._parse_journal_date() or datetime.datetime.now()
+        # an empty widget is detected from its end index, without copying the text out;
+        # the content is only fetched when there is something to save
+        content = text.get("1.0", "end-1c").strip() if text.index("end-1c") != "1.0" else ""
+        if content:
+            self.current_user.add_journal_entry(content, date=entry_date)
+            self._show_toast(text.master, "Entri jurnal tersimpan.")
+            text.delete("1.0", "end")
+        else:
+            messagebox.showwarning("Kosong", "Isi dulu jurnalnya ya.")
+
     def _open_affirmation_generator(self):
-        self.clear_window()
-        frame = tk.Frame(self, bg="#FFF4F7")
+        self._show_screen("affirmations")
+
+    def _build_affirmation_screen(self, screen):
+        frame = tk.Frame(screen, bg="#FFF4F7")
         frame.pack(fill="both", expand=True, padx=12, pady=12)
-        tk.Label(frame, text="My Affirmations", font=("Poppins", 16, "bold"), bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
+        tk.Label(frame, text="My Affirmations", font=self.fonts["heading"], bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
 
-        result_label = tk.Label(frame, text=self.random_provider.get_affirmation(), wraplength=700, bg="#FFF4F7", font=("Quicksand", 12))
+        result_label = tk.Label(frame, wraplength=700, bg="#FFF4F7", font=self.fonts["result"])
         result_label.pack(pady=12)
+        self._aff_result_label = result_label
 
         def gen_rand():
             result_label.config(text=self.random_provider.get_affirmation())
@@ -815,110 +1233,322 @@ class MineBloomApp(tk.Tk):
         def save_aff():
             aff = result_label.cget("text")
             # demonstrate encapsulation / stack usage: save to stack
-            self.stack.push({"saved_aff": aff, "date": datetime.datetime.now()})
-            messagebox.showinfo("Saved", "Afirmasi tersimpan ke gallery (undoable).")
+            self.stack.push(SavedAff(aff, datetime.datetime.now()))
+            self._show_toast(frame, "Afirmasi tersimpan ke gallery (undoable).")
         save_btn = self._make_button(frame, text="Save Affirmation", cmd=save_aff)
         save_btn.pack(pady=6)
 
-        back_btn = self._make_button(frame, text="Kembali", cmd=self._build_home_screen)
+        back_btn = self._make_button(frame, text="Kembali", cmd=self._go_home)
         back_btn.pack(pady=10)
 
+    def _reset_affirmation_screen(self):
+        self._aff_result_label.config(text=self.random_provider.get_affirmation())
+
+    # day rows kept built above and below the visible part of the passed journey
+    _JOURNEY_BUFFER = 3
+    # built day rows kept (hidden) for reuse when scrolling back or toggling the sort
+    _JOURNEY_CACHE_ROWS = 60
+    # passed journey styling, shared by every day row
+    _PINK = "#E05F7D"
+    _CARD_BG = "#FFFDEB"
+    # event.delta of one wheel notch (macOS reports single units)
+    _WHEEL_STEP = 1 if sys.platform == "darwin" else 120
+
     def _open_passed_journey(self):
-        # show saved journal entries grouped by date in a table-like, scrollable view
-        self.clear_window()
-        root = tk.Frame(self, bg="#FFF4F7")
+        self._show_screen("journey")
+
+    def _build_journey_screen(self, screen):
+        # show saved journal entries grouped by date in a table-like, scrollable view;
+        # only the day rows near the viewport exist as widgets, see _update_journey_viewport
+        root = tk.Frame(screen, bg="#FFF4F7")
         root.pack(fill="both", expand=True, padx=12, pady=12)
 
-        tk.Label(root, text="My Passed Journey", font=("Poppins", 20, "bold"), bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
+        tk.Label(root, text="My Passed Journey", font=self.fonts["journey_title"], bg="#FFF4F7", fg="#E05F7D").pack(pady=6)
 
         # controls
         ctrl = tk.Frame(root, bg="#FFF4F7")
         ctrl.pack(fill="x", pady=6)
-        sort_var = tk.StringVar(value="newest")
-        newest_btn = self._make_button(ctrl, text="Newest first", cmd=lambda: (sort_var.set("newest"), draw_entries()), bg=None)
+        self._journey_sort = tk.StringVar(value="newest")
+        newest_btn = self._make_button(ctrl, text="Newest first", cmd=lambda: (self._journey_sort.set("newest"), self._draw_journey_entries()), bg=None)
         newest_btn.pack(side="left", padx=6)
-        oldest_btn = self._make_button(ctrl, text="Oldest first", cmd=lambda: (sort_var.set("oldest"), draw_entries()), bg=None)
+        oldest_btn = self._make_button(ctrl, text="Oldest first", cmd=lambda: (self._journey_sort.set("oldest"), self._draw_journey_entries()), bg=None)
         oldest_btn.pack(side="left", padx=6)
 
-        # scrollable canvas
+        # scrollable canvas; every scroll or resize re-checks which rows are visible
         canvas_frame = tk.Frame(root, bg="#FFF4F7")
         canvas_frame.pack(fill="both", expand=True)
         canvas = tk.Canvas(canvas_frame, bg="#FFF4F7", highlightthickness=0)
         vsb = tk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
-        canvas.configure(yscrollcommand=vsb.set)
+
+        def on_yscroll(first, last):
+            vsb.set(first, last)
+            self._update_journey_viewport()
+
+        canvas.configure(yscrollcommand=on_yscroll)
         vsb.pack(side="right", fill="y")
         canvas.pack(side="left", fill="both", expand=True)
-        inner = tk.Frame(canvas, bg="#FFF4F7")
-        canvas.create_window((0,0), window=inner, anchor='nw')
-
-        def on_config(event=None):
-            canvas.configure(scrollregion=canvas.bbox('all'))
-
-        inner.bind('<Configure>', on_config)
-
-        # group entries by date
-        def group_by_date():
-            entries = list(self.current_user.get_journal_entries())
-            # sort ascending first
-            entries.sort(key=lambda it: it[0])
-            groups = {}
-            for dt, content in entries:
-                key = dt.date().isoformat()
-                groups.setdefault(key, []).append((dt, content))
-            # order groups by date according to sort_var
-            ordered = sorted(groups.items(), key=lambda kv: kv[0], reverse=(sort_var.get()=="newest"))
-            return ordered
-
-        # draw entries as table-like rows: left column date, right column entries in pastel boxes
-        def draw_entries():
-            for w in inner.winfo_children():
-                w.destroy()
-            ordered = group_by_date()
-            row = 0
-            girly_font = ("Segoe Script", 14, "italic")
-            pink = "#E05F7D"
-            for date_str, items in ordered:
-                # date label cell
-                date_lbl = tk.Label(inner, text=f"🌸 {date_str}", font=("Poppins", 14, "bold"), bg="#FFF4F7", fg=pink)
-                date_lbl.grid(row=row, column=0, sticky="nw", padx=8, pady=(12,4))
-
-                # entries column: container frame
-                cell = tk.Frame(inner, bg="#FFF4F7")
-                cell.grid(row=row, column=1, sticky="nw", padx=6, pady=(8,4))
-                # each day gets its own pastel box
-                day_frame = tk.Frame(cell, bg="#FFF7D6", bd=0, relief='flat')
-                day_frame.pack(fill="x", expand=True, pady=4)
-                for dt, content in items:
-                    # small card per entry
-                    card = tk.Frame(day_frame, bg="#FFFDEB", bd=1, relief='solid')
-                    card.pack(fill="x", padx=8, pady=6)
-                    time_lbl = tk.Label(card, text=dt.strftime('%H:%M'), font=("Quicksand", 10), bg="#FFFDEB", fg="#8B6C8E")
-                    time_lbl.pack(anchor='ne', padx=6, pady=2)
-                    # remove emoji ordinal like ' (3)' after emoji when showing in passed journey
-                    display_content = content
-                    if display_content.startswith("Mood:"):
-                        lines = display_content.split('\n')
-                        # remove any trailing ' (number)' after emoji in first line
-                        lines[0] = re.sub(r"\s*\(\d+\)", "", lines[0])
-                        display_content = "\n".join(lines)
-                    # content: two-line layout (date separate already); girly font & pink
-                    content_lbl = tk.Label(card, text=display_content, font=girly_font, bg="#FFFDEB", fg=pink, justify='left', wraplength=600)
-                    content_lbl.pack(anchor='w', padx=8, pady=6)
-                row += 1
-
-        draw_entries()
-
-        back_btn = self._make_button(root, text="Kembali", cmd=self._build_home_screen, bg=None)
+        canvas.bind('<Configure>', lambda event: self._update_journey_viewport())
+        self._journey_canvas = canvas
+
+        self._journey_days = []      # (date_str, items) per day, ascending
+        self._journey_rows = []      # the same days in display order
+        self._journey_heights = {}   # date_str -> estimated height, replaced by the real one once built
+        self._journey_offsets = [0]  # y of each row in display order, then the total height
+        self._journey_pool = {}      # date_str -> (row frame, canvas window id), least recently shown first
+        self._journey_revision = None  # journal revision the cached rows were built from
+        self._journey_updating = False
+        self._journey_prefetch_job = None  # idle callback building the buffer rows
+        self._journey_scroll_pending = False  # scrollregion update queued with after_idle
+        # wheel events are summed and applied at most once per frame, see _on_journey_wheel
+        self._wheel_accum = 0
+        self._wheel_pending = False
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_all(sequence, self._on_journey_wheel)
+        # line heights used to estimate rows that have not been built yet
+        self._journey_line_h = (self.fonts["small"].metrics("linespace"),
+                                self.fonts["girly"].metrics("linespace"))
+
+        back_btn = self._make_button(root, text="Kembali", cmd=self._go_home, bg=None)
         back_btn.pack(pady=8)
 
+    def _reset_journey_screen(self):
+        self._journey_sort.set("newest")
+        self._draw_journey_entries()
+
+    # lay the journey list out in the selected order; rows are built on demand
+    def _draw_journey_entries(self):
+        canvas = self._journey_canvas
+        revision = self.current_user.journal_revision
+        if revision != self._journey_revision:
+            # entries changed since the rows were cached: drop them and regroup
+            for frame, _ in self._journey_pool.values():
+                frame.destroy()
+            self._journey_pool.clear()
+            canvas.delete("all")
+            self._journey_days = self.current_user.grouped_journal_entries()
+            self._journey_heights = {date_str: self._estimate_journey_row(items)
+                                     for date_str, items in self._journey_days}
+            self._journey_revision = revision
+        # a sort toggle only reorders: cached rows are moved, not rebuilt
+        days = self._journey_days
+        self._journey_rows = days[::-1] if self._journey_sort.get() == "newest" else days
+        self._relayout_journey()
+        canvas.yview_moveto(0)
+        self._update_journey_viewport()
+
+    def _estimate_journey_row(self, items):
+        # mirrors the paddings used in _build_journey_row; wrapped lines are not counted
+        time_h, content_h = self._journey_line_h
+        text = sum(time_h + content_h * (content.count("\n") + 2) for _, content in items)
+        return 50 + text
+
+    @staticmethod
+    def _fit_journey_text(text):
+        # size a day's Text to its wrapped content; returns False while the canvas has not
+        # drawn the row yet: the Text is then 1 pixel wide and would wrap every character,
+        # so it keeps its logical-line height until it is fitted on screen
+        if text.winfo_width() <= 1:
+            return False
+        count = text.count('1.0', 'end-1c', 'displaylines')
+        text.configure(height=(count[0] if count else 0) + 1)
+        return True
+
+    def _relayout_journey(self):
+        canvas = self._journey_canvas
+        heights = self._journey_heights
+        rows = self._journey_rows
+        offsets = self._journey_offsets = [0, *accumulate(heights[date_str] for date_str, _ in rows)]
+        pool = self._journey_pool
+        for idx, (date_str, _) in enumerate(rows):
+            if date_str in pool:
+                canvas.coords(pool[date_str][1], 0, offsets[idx])
+        # the scrollregion is applied once per idle pass, however often rows are re-measured
+        if not self._journey_scroll_pending:
+            self._journey_scroll_pending = True
+            self.after_idle(self._apply_journey_scrollregion)
+
+    def _on_journey_wheel(self, event):
+        if self._current_screen != "journey":
+            return
+        # X11 reports wheel steps as buttons 4/5 without a delta
+        delta = event.delta or (self._WHEEL_STEP if event.num == 4 else -self._WHEEL_STEP)
+        self._wheel_accum += delta
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            self.after(16, self._flush_journey_wheel)
+
+    def _flush_journey_wheel(self):
+        self._wheel_pending = False
+        # whole steps only; the remainder of high-resolution wheels carries over
+        units = int(-self._wheel_accum / self._WHEEL_STEP)
+        self._wheel_accum += units * self._WHEEL_STEP
+        canvas = self._journey_canvas
+        if units and canvas.winfo_exists():
+            canvas.yview_scroll(units, "units")
+
+    def _apply_journey_scrollregion(self):
+        self._journey_scroll_pending = False
+        canvas = self._journey_canvas
+        if canvas.winfo_exists():
+            canvas.configure(scrollregion=(0, 0, canvas.winfo_width(), self._journey_offsets[-1]))
+
+    def _update_journey_viewport(self, prefetch=False):
+        # show the rows intersecting the viewport (plus a small buffer); other cached
+        # rows are hidden and the least recently shown ones beyond the cap destroyed.
+        # Missing buffer rows are only built with `prefetch`, from an idle callback.
+        rows = self._journey_rows
+        if self._journey_updating or not rows:
+            return
+        self._journey_updating = True
+        try:
+            canvas = self._journey_canvas
+            offsets = self._journey_offsets
+            pool = self._journey_pool
+            top = canvas.canvasy(0)
+            bottom = top + canvas.winfo_height()
+            shown_first = max(bisect_right(offsets, top) - 1, 0)
+            shown_last = bisect_left(offsets, bottom)
+            first = max(shown_first - self._JOURNEY_BUFFER, 0)
+            last = min(shown_last + self._JOURNEY_BUFFER, len(rows))
+            visible = {rows[idx][0] for idx in range(first, last)}
+            for date_str, (_, window_id) in pool.items():
+                if date_str not in visible:
+                    canvas.itemconfigure(window_id, state="hidden")
+            built = []
+            refit = []
+            deferred = False
+            for idx in range(first, last):
+                date_str, items = rows[idx]
+                cached = pool.pop(date_str, None)
+                if cached is None:
+                    if not prefetch and not shown_first <= idx < shown_last:
+                        deferred = True
+                        continue
+                    # only create the widgets here; they are placed together below
+                    built.append((idx, date_str, self._build_journey_row(date_str, items)))
+                    continue
+                canvas.itemconfigure(cached[1], state="normal")
+                # re-insert so the pool stays ordered from least to most recently shown
+                pool[date_str] = cached
+                if not cached[0].fitted and shown_first <= idx < shown_last:
+                    # prefetched off screen; fit it now that the canvas draws it
+                    refit.append((date_str, cached[0]))
+            for idx, date_str, frame in built:
+                pool[date_str] = (frame, canvas.create_window(0, offsets[idx], window=frame, anchor="nw"))
+            for date_str in list(pool)[:max(len(pool) - self._JOURNEY_CACHE_ROWS, 0)]:
+                if date_str not in visible:
+                    frame, window_id = pool.pop(date_str)
+                    canvas.delete(window_id)
+                    frame.destroy()
+            measured = [(date_str, frame) for _, date_str, frame in built] + refit
+            if measured:
+                # swap the estimates of the new rows for their real height
+                canvas.update_idletasks()
+                for _, frame in measured:
+                    frame.fitted = self._fit_journey_text(frame.day_text)
+                canvas.update_idletasks()
+                heights = self._journey_heights
+                changed = False
+                for date_str, frame in measured:
+                    height = frame.winfo_reqheight()
+                    if height != heights[date_str]:
+                        heights[date_str] = height
+                        changed = True
+                if changed:
+                    self._relayout_journey()
+            if deferred and self._journey_prefetch_job is None:
+                self._journey_prefetch_job = self.after_idle(self._prefetch_journey_rows)
+        finally:
+            self._journey_updating = False
+
+    def _prefetch_journey_rows(self):
+        self._journey_prefetch_job = None
+        # the journey screen may have been destroyed (logout) before the idle pass
+        if self._journey_canvas.winfo_exists():
+            self._update_journey_viewport(prefetch=True)
+
+    # one table-like row: left column date, right column the day's entries in pastel boxes
+    def _build_journey_row(self, date_str, items):
+        pink = self._PINK
+        row = tk.Frame(self._journey_canvas, bg="#FFF4F7")
+        # date label cell
+        date_lbl = tk.Label(row, text=f"🌸 {date_str}", font=self.fonts["daily"], bg="#FFF4F7", fg=pink)
+        date_lbl.grid(row=0, column=0, sticky="nw", padx=8, pady=(12,4))
+
+        # entries column: container frame
+        cell = tk.Frame(row, bg="#FFF4F7")
+        cell.grid(row=0, column=1, sticky="nw", padx=6, pady=(8,4))
+        # each day gets its own pastel box: one Text for all of the day's entries,
+        # styled with tags instead of a frame and two labels per entry
+        day_frame = tk.Frame(cell, bg="#FFF7D6", bd=0, relief='flat')
+        day_frame.pack(fill="x", expand=True, pady=4)
+        # the widget font is the content font, so its line-based height fits the content lines
+        text = tk.Text(day_frame, wrap='word', width=50, font=self.fonts["girly"], bg=self._CARD_BG, bd=1, relief='solid',
+                       padx=8, pady=6, highlightthickness=0, cursor='arrow')
+        text.tag_configure('time', font=self.fonts["small"], foreground="#8B6C8E", justify='right')
+        text.tag_configure('content', font=self.fonts["girly"], foreground=pink, spacing3=6)
+        lines = 0
+        for n, (dt, content) in enumerate(items):
+            # remove emoji ordinal like ' (3)' after emoji when showing in passed journey
+            display_content = content
+            if display_content.startswith("Mood:"):
+                first, sep, rest = display_content.partition('\n')
+                # remove the trailing ' (number)' after emoji in first line; the app writes
+                # it itself, so plain string checks are enough
+                i = first.rfind(' (')
+                if i > 0 and first.endswith(')') and first[i+2:-1].isdigit():
+                    display_content = first[:i] + sep + rest
+            text.insert('end', dt.strftime('%H:%M\n'), 'time')
+            # content: two-line layout (date separate already); girly font & pink
+            text.insert('end', display_content if n == len(items) - 1 else display_content + '\n\n', 'content')
+            lines += display_content.count('\n') + 3
+        # logical lines for now; _fit_journey_text corrects for wrapping once the row is laid out
+        text.configure(state='disabled', height=lines - 1)
+        text.pack(fill="x", padx=8, pady=6)
+        row.day_text = text
+        row.fitted = False  # set by _update_journey_viewport once sized to its wrapped lines
+        return row
+
     # ---------- Utilities ----------
+    def _show_toast(self, parent, msg, ms=1500):
+        # short inline notice at the bottom of `parent`; unlike a messagebox it does not block
+        if self._toast is not None:
+            self._toast.destroy()
+        toast = self._toast = tk.Label(parent, text=msg, bg="#E05F7D", fg="#FFFFFF", padx=12, pady=6,
+                                       font=self.fonts["label"])
+        toast.place(relx=0.5, rely=1.0, anchor="s", y=-10)
+        self.after(ms, lambda: self._hide_toast(toast))
+
+    def _hide_toast(self, toast):
+        if toast is self._toast:
+            self._toast = None
+        toast.destroy()
+
     def _show_random_affirmation(self):
         txt = self.random_provider.get_affirmation()
         messagebox.showinfo("Affirmation", txt)
 
+    def _flush_current_user(self):
+        if self.current_user is not None:
+            self.current_user.flush()
+
+    def _on_close(self):
+        self._flush_current_user()
+        self.destroy()
+
+    def _make_root_container(self):
+        container = tk.Frame(self, bg="#FFF4F7")
+        container.grid(row=0, column=0, sticky="nsew")
+        container.grid_rowconfigure(0, weight=1)
+        container.grid_columnconfigure(0, weight=1)
+        return container
+
     def clear_window(self):
-        for widget in self.winfo_children():
-            widget.destroy()
+        # drop every cached screen in one go by swapping the container that holds them;
+        # they are rebuilt on their next _show_screen
+        self._root_container.destroy()
+        self._root_container = self._make_root_container()
+        self._screens.clear()
 
 # =========================
 # RUN